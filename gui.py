@@ -0,0 +1,1117 @@
+"""
+Tkinter GUI for the Application Screenshot Discord Bot
+Imported lazily by main.py so headless/console runs never load tkinter
+"""
+
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+
+
+class ToggleSwitch(tk.Canvas):
+    """
+    A custom tkinter widget that acts as a sliding toggle switch with rounded edges.
+    """
+    def __init__(self, master, on_command=None, off_command=None, **kwargs):
+        super().__init__(master, width=50, height=26, highlightthickness=0, **kwargs)
+        self.on_color = '#22c55e'
+        self.off_color = '#6b7280'
+        self.toggle_color = '#ffffff'
+        self.state = False
+        self.on_command = on_command
+        self.off_command = off_command
+        
+        # Create the shapes once; draw_toggle only recolors and moves them
+        self._bg_l = self.create_oval(2, 2, 24, 24)
+        self._bg_r = self.create_oval(26, 2, 48, 24)
+        self._bg_m = self.create_rectangle(12, 2, 38, 24)
+        self._knob = self.create_oval(2, 2, 22, 24, fill=self.toggle_color, outline=self.toggle_color)
+        
+        self.bind('<Button-1>', self.toggle)
+        self.draw_toggle()
+
+    def draw_toggle(self):
+        """Draws the toggle switch based on its current state."""
+        bg_color = self.on_color if self.state else self.off_color
+        
+        # Recolor the rounded rectangle background
+        for item in (self._bg_l, self._bg_r, self._bg_m):
+            self.itemconfig(item, fill=bg_color, outline=bg_color)
+        
+        # Slide the knob to the matching side
+        if self.state:
+            self.coords(self._knob, 28, 2, 48, 24)
+        else:
+            self.coords(self._knob, 2, 2, 22, 24)
+
+    def toggle(self, event=None):
+        """Toggles the state of the switch and executes the corresponding command."""
+        self.state = not self.state
+        self.draw_toggle()
+        if self.state and self.on_command:
+            self.on_command()
+        elif not self.state and self.off_command:
+            self.off_command()
+
+
+class ScreenshotBotGUI:
+    # Status log is trimmed back to LOG_KEEP_LINES once it passes LOG_MAX_LINES,
+    # checked every LOG_TRIM_EVERY flushes
+    LOG_MAX_LINES = 2000
+    LOG_KEEP_LINES = 1500
+    LOG_TRIM_EVERY = 64
+    
+    # Log line glyph and text tag for each message type
+    _LOG_PREFIX = {
+        'success': ("✅ ", 'success'),
+        'error': ("❌ ", 'error'),
+        'warning': ("⚠ ", 'warning'),
+        'info': ("ℹ ", 'info'),
+    }
+    # Foreground colour of each status log text tag
+    _LOG_TAGS = {
+        'success': '#4ade80',
+        'error': '#ef4444',
+        'warning': '#f59e0b',
+        'info': '#3b82f6',
+        'timestamp': '#6b7280',
+    }
+    
+    # Shared look of the large action buttons, see _button
+    _BTN_STYLE = {'font': ('Segoe UI', 11, 'bold'), 'fg': 'white', 'bd': 0, 'pady': 10, 'cursor': 'hand2'}
+    # Button colour -> darker shade shown while hovered
+    _BTN_HOVER = {
+        '#3b82f6': '#2563eb',
+        '#22c55e': '#16a34a',
+        '#ef4444': '#dc2626',
+        '#6366f1': '#4f46e5',
+        '#6b7280': '#4b5563',
+        '#374151': '#4b5563',
+    }
+    
+    def __init__(self, bot):
+        self.bot = bot
+        self.config_found = self.bot.load_config()
+        self.root = tk.Tk()
+        self.root.title("Screenshot Discord Bot")
+        self.root.geometry("1300x900")
+        self.root.resizable(True, True)
+        self.root.configure(bg='#1e1e1e')
+        
+        
+        self.fade_alpha = 0.0
+        self.pulse_scale = 1.0
+        self.pulse_direction = 1
+        self.pulse_size = 12
+        self._pulse_active = False
+        self._status_drain_active = False
+        self.status_colors = {
+            'success': '#4ade80',
+            'error': '#ef4444',
+            'warning': '#f59e0b',
+            'info': '#3b82f6'
+        }
+        
+        # (due_time, step) jobs driven by a single after() timer, see _tick
+        self._anim_jobs = []
+        self._tick_id = None
+        self._tick_due = None
+        self._preview_after_id = None
+        self._scrollregion_after = None
+        
+        # Dialogs are built on first open and withdrawn instead of destroyed
+        self._help_window = None
+        self._notification = None
+        self._notification_after_id = None
+        self._app_window = None
+        self._all_apps = None
+        self._all_apps_lower = []
+        self._apps_shown = []
+        self._app_query = None
+        self._app_filter_id = None
+        self._app_refresh = None
+        
+        # Last state applied by update_status; None forces the first update
+        self._last_running = None
+        self._last_title_state = None
+        
+        # (timestamp, message, type) entries waiting for _flush_log
+        self._log_buffer = []
+        self._log_flush_scheduled = False
+        self._log_flushes = 0
+        self._ts_epoch = 0
+        self._ts_str = ""
+        
+        # Results from the bot's monitoring threads; only the Tk thread touches widgets
+        self._bot_status = queue.SimpleQueue()
+        self.bot.on_status = self._on_bot_status
+        
+        
+        self.setup_styles()
+        
+        
+        self.create_animated_header()
+        
+        self.create_widgets()
+        self.update_status()
+        
+        
+        self.schedule_job(0, self.animate_fade_in)
+        
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+    
+    def on_closing(self):
+        """Handle window closing - save config and stop monitoring"""
+        if self.bot.running:
+            self.bot.stop_monitoring()
+        self.root.destroy()
+    
+    def setup_styles(self):
+        """Setup dark theme styles with modern look"""
+        style = ttk.Style()
+        
+        
+        style.theme_use('clam')
+        # Buttons get their hover colour from activebackground; keep the label white
+        self.root.option_add('*Button.activeForeground', 'white')
+        
+        
+        bg_color = '#1e1e1e'
+        card_color = '#2d2d2d'
+        accent_color = '#3b82f6'
+        text_color = '#ffffff'
+        secondary_text = '#a1a1aa'
+        
+        
+        style.configure('Title.TLabel', 
+                       background=bg_color, 
+                       foreground=text_color,
+                       font=('Segoe UI', 24, 'bold'))
+        
+        style.configure('Card.TFrame', 
+                       background=card_color,
+                       relief='flat',
+                       borderwidth=1)
+        
+        style.configure('Modern.TLabel',
+                       background=card_color,
+                       foreground=text_color,
+                       font=('Segoe UI', 10))
+        
+        style.configure('Secondary.TLabel',
+                       background=card_color,
+                       foreground=secondary_text,
+                       font=('Segoe UI', 9))
+        
+        style.configure('Modern.TEntry',
+                       borderwidth=1,
+                       relief='flat',
+                       font=('Segoe UI', 10),
+                       fieldbackground='#374151',
+                       foreground=text_color,
+                       bordercolor=accent_color,
+                       lightcolor=accent_color,
+                       darkcolor=accent_color)
+        
+        style.configure('Action.TButton',
+                       font=('Segoe UI', 10, 'bold'),
+                       borderwidth=0,
+                       focuscolor='none')
+        
+        style.map('Action.TButton',
+                 background=[('active', '#2563eb'), ('!active', accent_color)],
+                 foreground=[('active', 'white'), ('!active', 'white')])
+        
+        style.configure('Success.TButton',
+                       font=('Segoe UI', 10, 'bold'),
+                       borderwidth=0,
+                       focuscolor='none')
+        
+        style.map('Success.TButton',
+                 background=[('active', '#16a34a'), ('!active', '#22c55e')],
+                 foreground=[('active', 'white'), ('!active', 'white')])
+        
+        style.configure('Danger.TButton',
+                       font=('Segoe UI', 10, 'bold'),
+                       borderwidth=0,
+                       focuscolor='none')
+        
+        style.map('Danger.TButton',
+                 background=[('active', '#dc2626'), ('!active', '#ef4444')],
+                 foreground=[('active', 'white'), ('!active', 'white')])
+    
+    def create_animated_header(self):
+        """Create animated header with gradient effect"""
+        self.header_frame = tk.Frame(self.root, bg='#1e1e1e', height=100)
+        self.header_frame.pack(fill=tk.X, pady=(0, 20))
+        self.header_frame.pack_propagate(False)
+        
+        
+        self.title_label = tk.Label(
+            self.header_frame,
+            text="Screenshot Discord Bot",
+            font=('Segoe UI', 28, 'bold'),
+            fg='#3b82f6',
+            bg='#1e1e1e'
+        )
+        self.title_label.pack(expand=True)
+        
+        
+        self.subtitle_label = tk.Label(
+            self.header_frame,
+            text="",
+            font=('Segoe UI', 12),
+            fg='#a1a1aa',
+            bg='#1e1e1e'
+        )
+        self.subtitle_label.pack()
+        
+        
+        self.typewriter_text = "Automated screenshot capture and Discord integration"
+        self.typewriter_index = 0
+        self.schedule_job(2000, self.animate_typewriter)
+    
+    def schedule_job(self, delay_ms, step):
+        """Queue an animation step on the shared tick
+        
+        The step returns the delay in ms until it should run again, or None when done.
+        """
+        due = time.monotonic() + delay_ms / 1000
+        self._anim_jobs.append((due, step))
+        if self._tick_due is None or due < self._tick_due:
+            self._arm_tick()
+    
+    def _arm_tick(self):
+        """(Re)arm the single after() timer for the earliest pending job"""
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = self._tick_due = None
+        if self._anim_jobs:
+            self._tick_due = min(due for due, _ in self._anim_jobs)
+            delay = max(1, int((self._tick_due - time.monotonic()) * 1000))
+            self._tick_id = self.root.after(delay, self._tick)
+    
+    def _tick(self):
+        """Run every due animation step, then sleep until the next one is due"""
+        self._tick_id = self._tick_due = None
+        now = time.monotonic()
+        due_jobs = [job for job in self._anim_jobs if job[0] <= now]
+        self._anim_jobs = [job for job in self._anim_jobs if job[0] > now]
+        
+        minimized = self.root.state() == 'iconic'
+        for _, step in due_jobs:
+            # Nothing is visible while minimized, so just check back later
+            delay = 250 if minimized else step()
+            if delay is not None:
+                self._anim_jobs.append((now + delay / 1000, step))
+        self._arm_tick()
+    
+    def animate_typewriter(self):
+        """Advance the typewriter effect for subtitle by one character"""
+        if self.typewriter_index <= len(self.typewriter_text):
+            self.subtitle_label.config(text=self.typewriter_text[:self.typewriter_index])
+            self.typewriter_index += 1
+            return 50
+        return None
+    
+    def animate_fade_in(self):
+        """Advance the window fade in effect by one step"""
+        if self.fade_alpha < 1.0:
+            self.fade_alpha += 0.05
+            return 30
+        return None
+    
+    def start_pulse(self):
+        """Start the monitoring pulse animation if it isn't already running"""
+        if not self._pulse_active:
+            self._pulse_active = True
+            self.schedule_job(50, self.animate_pulse)
+    
+    def animate_pulse(self):
+        """Advance the pulsing effect for monitoring status by one step
+        
+        Stops itself (returns None) once monitoring is no longer running.
+        """
+        if not self.bot.running:
+            self._pulse_active = False
+            self.pulse_scale = 1.0
+            self.pulse_direction = 1
+            self._set_pulse_size(12)
+            return None
+        
+        self.pulse_scale += 0.02 * self.pulse_direction
+        if self.pulse_scale >= 1.1:
+            self.pulse_direction = -1
+        elif self.pulse_scale <= 0.9:
+            self.pulse_direction = 1
+        
+        
+        self._set_pulse_size(int(12 * self.pulse_scale))
+        return 50
+    
+    def _set_pulse_size(self, pulse_size):
+        """Resize the status dot, skipping the canvas update when unchanged"""
+        if pulse_size != self.pulse_size:
+            self.pulse_size = pulse_size
+            r = pulse_size / 2
+            self.status_indicator.coords(self._status_dot, 10 - r, 10 - r, 10 + r, 10 + r)
+    
+    def create_widgets(self):
+        """Create all GUI widgets including scrollable content area."""
+        
+        self.canvas = tk.Canvas(self.root, bg='#1e1e1e', highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.canvas.yview)
+        self.scrollable_frame = tk.Frame(self.canvas, bg='#1e1e1e')
+        
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(30, 0), pady=(20, 20))
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 30), pady=(20, 20))
+        
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
+        
+        # Only scroll the page while the pointer is over it, so the log and popups keep their own wheel
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+
+        # Left and Right split
+        left_frame = tk.Frame(self.scrollable_frame, bg='#1e1e1e')
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15))
+
+        self.right_frame = tk.Frame(self.scrollable_frame, bg='#1e1e1e', width=350)
+        # Note: self.right_frame is not expanded vertically to prevent stretching
+        self.right_frame.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Left side cards
+        config_card = self.create_card(left_frame, "Configuration")
+        config_card.pack(fill=tk.X, pady=(0, 20))
+        
+        # Webhook URL
+        webhook_frame = tk.Frame(config_card, bg='#2d2d2d')
+        webhook_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
+        webhook_label = tk.Label(webhook_frame, text="Discord Webhook URL", 
+                                font=('Segoe UI', 10, 'bold'), fg='#ffffff', bg='#2d2d2d')
+        webhook_label.pack(anchor=tk.W)
+        webhook_desc = tk.Label(webhook_frame, text="Enter your Discord webhook URL to send screenshots (separate several with commas)",
+                                font=('Segoe UI', 8), fg='#a1a1aa', bg='#2d2d2d')
+        webhook_desc.pack(anchor=tk.W)
+        self.webhook_var = tk.StringVar(value=self.bot.webhook_url)
+        webhook_entry = ttk.Entry(webhook_frame, textvariable=self.webhook_var, style='Modern.TEntry')
+        webhook_entry.pack(fill=tk.X, ipady=5, pady=(5, 0))
+
+        # Application Name
+        app_frame = tk.Frame(config_card, bg='#2d2d2d')
+        app_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        app_label = tk.Label(app_frame, text="Application Name", 
+                            font=('Segoe UI', 10, 'bold'), fg='#ffffff', bg='#2d2d2d')
+        app_label.pack(anchor=tk.W)
+        app_desc = tk.Label(app_frame, text="Choose which application to screenshot",
+                            font=('Segoe UI', 8), fg='#a1a1aa', bg='#2d2d2d')
+        app_desc.pack(anchor=tk.W)
+        self.app_var = tk.StringVar(value=self.bot.app_name)
+        
+        app_entry_frame = tk.Frame(app_frame, bg='#2d2d2d')
+        app_entry_frame.pack(fill=tk.X, pady=(5,0))
+        
+        app_entry = ttk.Entry(app_entry_frame, textvariable=self.app_var, style='Modern.TEntry')
+        app_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
+        app_btn = tk.Button(app_entry_frame, text="Browse", font=('Segoe UI', 9, 'bold'),
+                            bg='#6b7280', fg='white', activebackground='#4b5563', bd=0, padx=10, pady=5,
+                            cursor='hand2', command=self.show_applications)
+        app_btn.pack(side=tk.LEFT, padx=(5, 0))
+
+
+        # Custom Message
+        message_frame = tk.Frame(config_card, bg='#2d2d2d')
+        message_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        message_label = tk.Label(message_frame, text="Custom Message", 
+                                font=('Segoe UI', 10, 'bold'), fg='#ffffff', bg='#2d2d2d')
+        message_label.pack(anchor=tk.W)
+        
+        message_desc = tk.Label(message_frame, text="customize the message sent with screenshots. Leave empty for only image",
+                                font=('Segoe UI', 8), fg='#a1a1aa', bg='#2d2d2d')
+        message_desc.pack(anchor=tk.W)
+        
+        # Frame to hold entry and help button together
+        entry_help_frame = tk.Frame(message_frame, bg='#2d2d2d')
+        entry_help_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        self.message_var = tk.StringVar(value=self.bot.custom_message)
+        message_entry = ttk.Entry(entry_help_frame, textvariable=self.message_var, style='Modern.TEntry')
+        message_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
+        
+        message_help_btn = tk.Button(entry_help_frame, text="?", font=('Segoe UI', 8, 'bold'),
+                                     bg='#374151', fg='#ffffff', bd=0, width=2,
+                                     cursor='hand2', command=self.show_message_help)
+        message_help_btn.pack(side=tk.LEFT, padx=(5, 0))
+
+        self.message_preview = tk.Label(message_frame, text="", 
+                                       font=('Segoe UI', 8, 'italic'), fg='#4ade80', bg='#2d2d2d')
+        self.message_preview.pack(anchor=tk.W, pady=(5, 0))
+        self.message_var.trace('w', self.update_message_preview)
+        self._do_update_preview()
+        
+        # Interval & Delete after send
+        options_frame = tk.Frame(config_card, bg='#2d2d2d')
+        options_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        
+        interval_frame = tk.Frame(options_frame, bg='#2d2d2d')
+        interval_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        interval_label = tk.Label(interval_frame, text="Interval (seconds):", 
+                                font=('Segoe UI', 10), fg='#ffffff', bg='#2d2d2d')
+        interval_label.pack(anchor=tk.W)
+        self.interval_var = tk.StringVar(value=str(int(self.bot.interval)))
+        # Only whole numbers can be typed, so update_config never has to parse junk
+        interval_vcmd = (self.root.register(self._valid_interval), '%P')
+        interval_entry = ttk.Entry(interval_frame, textvariable=self.interval_var, style='Modern.TEntry',
+                                   validate='key', validatecommand=interval_vcmd)
+        interval_entry.pack(fill=tk.X, ipady=5, pady=(5, 0))
+        
+        # New Toggle Switch for Delete After Send
+        toggle_frame = tk.Frame(options_frame, bg='#2d2d2d')
+        toggle_frame.pack(side=tk.RIGHT, padx=(10, 0), pady=(15, 0))
+        toggle_label = tk.Label(toggle_frame, text="Delete after send:",
+                                font=('Segoe UI', 10), fg='#ffffff', bg='#2d2d2d')
+        toggle_label.pack(side=tk.LEFT, padx=(0, 5))
+        self.delete_var = tk.BooleanVar(value=self.bot.delete_after_send)
+        self.delete_toggle = ToggleSwitch(
+            toggle_frame, 
+            bg='#2d2d2d', 
+            on_command=self._delete_on,
+            off_command=self._delete_off
+        )
+        self.delete_toggle.pack(side=tk.LEFT)
+        if self.bot.delete_after_send:
+            self.delete_toggle.state = True
+            self.delete_toggle.draw_toggle()
+            
+        # Save Configuration Button
+        save_frame = tk.Frame(config_card, bg='#2d2d2d')
+        save_frame.pack(fill=tk.X, padx=20, pady=(10, 20))
+        
+        self.save_btn = self._button(save_frame, "Save Configuration", '#6366f1', self.save_config_animated, padx=20)
+        self.save_btn.pack(expand=True)
+
+
+        # Actions Card
+        action_card = self.create_card(left_frame, "Actions")
+        action_card.pack(fill=tk.X, pady=(0, 20))
+        
+        btn_frame = tk.Frame(action_card, bg='#2d2d2d', padx=20, pady=20)
+        btn_frame.pack(fill=tk.X)
+        
+        self.screenshot_btn = self._button(btn_frame, "Take Screenshot", '#3b82f6', self.take_screenshot_animated, padx=20)
+        self.screenshot_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        
+        self.start_btn = self._button(btn_frame, "Start Monitoring", '#22c55e', self.start_monitoring_animated, padx=20)
+        self.start_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 5))
+        
+        self.stop_btn = self._button(btn_frame, "Stop Monitoring", '#ef4444', self.stop_monitoring_animated, padx=20, state='disabled')
+        self.stop_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+
+        # Show Console Toggle
+        console_toggle_frame = tk.Frame(action_card, bg='#2d2d2d')
+        console_toggle_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        console_label = tk.Label(console_toggle_frame, text="Show Status Log:",
+                                font=('Segoe UI', 10), fg='#ffffff', bg='#2d2d2d')
+        console_label.pack(side=tk.LEFT, padx=(0, 5))
+        self.show_console_var = tk.BooleanVar(value=True)
+        self.show_console_toggle = ToggleSwitch(
+            console_toggle_frame,
+            bg='#2d2d2d',
+            on_command=self.show_console,
+            off_command=self.hide_console
+        )
+        self.show_console_toggle.pack(side=tk.LEFT)
+        self.show_console_toggle.state = True
+        self.show_console_toggle.draw_toggle()
+
+        # Right side: Status & Activity
+        self.status_card = self.create_card(self.right_frame, "Status & Activity")
+        self.status_card.pack(fill=tk.BOTH, expand=True)
+
+        status_header = tk.Frame(self.status_card, bg='#2d2d2d')
+        status_header.pack(fill=tk.X, padx=20, pady=(10, 0))
+
+        # Drawn dot rather than a "●" label so the pulse only moves canvas coords
+        self.status_indicator = tk.Canvas(status_header, width=20, height=20,
+                                          bg='#2d2d2d', highlightthickness=0)
+        self._status_dot = self.status_indicator.create_oval(4, 4, 16, 16, fill='#ef4444', outline='')
+        self.status_indicator.pack(side=tk.LEFT)
+
+        self.status_text_label = tk.Label(status_header, text="Stopped", font=('Segoe UI', 11, 'bold'),
+                                         fg='#ffffff', bg='#2d2d2d')
+        self.status_text_label.pack(side=tk.LEFT, padx=(5, 0))
+
+        log_frame = tk.Frame(self.status_card, bg='#2d2d2d')
+        log_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 20))
+
+        self.status_text = tk.Text(log_frame, font=('Consolas', 9), bg='#1a1a1a',
+                                  fg='#e5e5e5', bd=0, padx=15, pady=10,
+                                  insertbackground='#3b82f6', selectbackground='#374151')
+
+        scrollbar = tk.Scrollbar(log_frame, bg='#374151', troughcolor='#2d2d2d',
+                                borderwidth=0, highlightthickness=0)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.status_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.status_text.config(yscrollcommand=scrollbar.set)
+        scrollbar.config(command=self.status_text.yview)
+
+        for tag, colour in self._LOG_TAGS.items():
+            self.status_text.tag_configure(tag, foreground=colour)
+        
+        self._recalc_scrollregion()
+    
+    def _schedule_scrollregion(self, event=None):
+        """Coalesce bursts of <Configure> events into one scrollregion update."""
+        if self._scrollregion_after is not None:
+            self.canvas.after_cancel(self._scrollregion_after)
+        self._scrollregion_after = self.canvas.after(30, self._recalc_scrollregion)
+    
+    def _recalc_scrollregion(self):
+        """Fit the canvas scrollregion to its contents."""
+        self._scrollregion_after = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _bind_mousewheel(self, event=None):
+        """Route wheel events to the page canvas while the pointer is over it."""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    
+    def _unbind_mousewheel(self, event=None):
+        """Stop routing wheel events once the pointer leaves the canvas."""
+        # Moving onto a widget embedded in the canvas also sends <Leave>; ignore that
+        widget = self.canvas.winfo_containing(*self.canvas.winfo_pointerxy())
+        if widget is not None and str(widget).startswith(str(self.canvas)):
+            return
+        self.canvas.unbind_all("<MouseWheel>")
+    
+    def _on_mousewheel(self, event):
+        """Handles mousewheel scrolling for the canvas."""
+        if event.widget is self.status_text:
+            return  # the log scrolls itself via its class binding
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+    def show_console(self):
+        """Show the status and activity log frame and resize the window."""
+        self.right_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(15, 0))
+        current_height = self.root.winfo_height()
+        self.root.geometry(f"1100x{current_height}")
+    
+    def hide_console(self):
+        """Hide the status and activity log frame and resize the window."""
+        self.right_frame.pack_forget()
+        current_height = self.root.winfo_height()
+        self.root.geometry(f"700x{current_height}")
+    
+    def show_message_help(self):
+        """Show help dialog for message variables, building it on first use"""
+        if self._help_window is not None:
+            self._help_window.deiconify()
+            self._help_window.lift()
+            self._help_window.grab_set()
+            return
+        
+        help_window = self._help_window = tk.Toplevel(self.root)
+        help_window.title("Message Variables Help")
+        help_window.geometry("600x500")
+        help_window.configure(bg='#1e1e1e')
+        help_window.resizable(False, False)
+        help_window.transient(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", self._hide_help_window)
+        help_window.grab_set()
+        
+        
+        header = tk.Frame(help_window, bg='#374151', height=60)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        title = tk.Label(header, text="Available Message Variables",
+                        font=('Segoe UI', 16, 'bold'), fg='#ffffff', bg='#374151')
+        title.pack(expand=True)
+        
+        
+        content_frame = tk.Frame(help_window, bg='#1e1e1e')
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        help_text = tk.Text(content_frame, font=('Consolas', 10), bg='#2d2d2d',
+                           fg='#ffffff', bd=0, padx=15, pady=15, wrap=tk.WORD)
+        help_text.pack(fill=tk.BOTH, expand=True)
+        
+        help_content = """Available Variables (use with curly braces):
+
+{app_name}     - Name of the target application
+{timestamp}    - Full date and time (YYYY-MM-DD HH:MM:SS)
+{date}         - Date only (YYYY-MM-DD)  
+{time}         - Time only (HH:MM:SS)
+{day}          - Day of the week (Monday, Tuesday, etc.)
+{month}        - Month name (January, February, etc.)
+{year}         - Year (YYYY)
+
+Examples:
+
+"Screenshot of {app_name} taken at {time}"
+→ "Screenshot of notepad taken at 14:30:25"
+
+"{app_name} capture on {day}"
+→ "notepad capture on Monday"
+
+"Daily {app_name} screenshot - {date}"
+→ "Daily notepad screenshot - 2024-01-15"
+
+"Custom message without variables"
+→ "Custom message without variables"
+
+Leave empty for no message (image only).
+"""
+        
+        help_text.insert(tk.END, help_content)
+        help_text.config(state=tk.DISABLED)
+        
+        
+        close_btn = self._button(content_frame, "Close", '#3b82f6', self._hide_help_window, padx=30)
+        close_btn.pack(pady=(10, 0))
+    
+    def _hide_help_window(self):
+        """Withdraw the help dialog so the next open can reuse it"""
+        self._help_window.grab_release()
+        self._help_window.withdraw()
+    
+    def update_message_preview(self, *args):
+        """Debounce preview updates so a burst of keystrokes formats only once"""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(150, self._do_update_preview)
+    
+    def _do_update_preview(self):
+        """Update the message preview"""
+        self._preview_after_id = None
+        try:
+            preview = self.bot.format_message(self.message_var.get())
+            
+            if preview and len(preview) > 80:
+                preview = preview[:77] + "..."
+            
+            self.message_preview.config(text=f"Preview: {preview}" if preview else "Preview: (no message)")
+        except Exception:
+            self.message_preview.config(text="Preview: (invalid format)")
+    
+    def save_config_animated(self):
+        """Save configuration from the current form values"""
+        self.update_config()
+        self.bot.save_config()
+        self.log_message_colored("Configuration saved successfully!", 'success')
+        self.show_notification("Success", "Configuration saved!", 'success')
+    
+    def _button(self, parent, text, bg, command, **options):
+        """Create a large action button in the shared style, with its hover shade"""
+        return tk.Button(parent, text=text, bg=bg, activebackground=self._BTN_HOVER[bg],
+                         command=command, **self._BTN_STYLE, **options)
+    
+    def create_card(self, parent, title):
+        """Create a modern card with title"""
+        card_frame = tk.Frame(parent, bg='#2d2d2d', relief='flat', bd=1)
+        
+        
+        header = tk.Frame(card_frame, bg='#374151', height=50)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        title_label = tk.Label(header, text=title, font=('Segoe UI', 14, 'bold'),
+                              fg='#ffffff', bg='#374151')
+        title_label.pack(expand=True)
+        
+        return card_frame
+    
+    def show_applications(self):
+        """Show running applications in a modern popup
+        
+        The window is built on first use and withdrawn on close, so later opens
+        show the last list straight away while a fresh one is gathered.
+        """
+        if self._app_window is None:
+            self._build_app_window()
+        else:
+            self._app_window.deiconify()
+            self._app_window.lift()
+        self._app_window.grab_set()
+        
+        self._app_search_var.set("")
+        self._filter_apps()
+        self._app_search_entry.focus_set()
+        self._refresh_apps()
+    
+    def _refresh_apps(self):
+        """List running applications on a worker thread so a busy system can't stall Tk"""
+        if self._app_refresh is not None and self._app_refresh.is_alive():
+            return
+        result = []
+        self._app_refresh = threading.Thread(
+            target=lambda: result.append(self.bot.list_running_applications()), daemon=True)
+        self._app_refresh.start()
+        self._app_window.after(50, self._finish_app_refresh, result)
+    
+    def _finish_app_refresh(self, result):
+        """Show the worker's application list once it is ready"""
+        if not result:
+            if self._app_refresh.is_alive():
+                self._app_window.after(50, self._finish_app_refresh, result)
+            return
+        apps = result[0]
+        if apps != self._all_apps:
+            self._all_apps = apps
+            self._all_apps_lower = [app.lower() for app in apps]
+            self._app_query = None  # force a full rebuild
+            self._filter_apps()
+    
+    def _build_app_window(self):
+        """Create the application picker window"""
+        app_window = self._app_window = tk.Toplevel(self.root)
+        app_window.title("Select Application")
+        app_window.geometry("500x600")
+        app_window.configure(bg='#1e1e1e')
+        app_window.resizable(False, False)
+        
+        
+        app_window.transient(self.root)
+        app_window.protocol("WM_DELETE_WINDOW", self._hide_app_window)
+        
+        
+        header = tk.Frame(app_window, bg='#374151', height=60)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        title = tk.Label(header, text="Select Target Application",
+                        font=('Segoe UI', 16, 'bold'), fg='#ffffff', bg='#374151')
+        title.pack(expand=True)
+        
+        
+        search_frame = tk.Frame(app_window, bg='#1e1e1e')
+        search_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        search_label = tk.Label(search_frame, text="Search:", font=('Segoe UI', 10),
+                               fg='#ffffff', bg='#1e1e1e')
+        search_label.pack(anchor=tk.W)
+        
+        self._app_search_var = tk.StringVar()
+        self._app_search_entry = tk.Entry(search_frame, textvariable=self._app_search_var,
+                                          font=('Segoe UI', 10), bg='#374151', fg='#ffffff',
+                                          bd=0, highlightthickness=1, highlightcolor='#3b82f6',
+                                          insertbackground='#ffffff')
+        self._app_search_entry.pack(fill=tk.X, ipady=8, pady=(5, 0))
+        
+        
+        list_frame = tk.Frame(app_window, bg='#1e1e1e')
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        
+        
+        listbox_frame = tk.Frame(list_frame, bg='#2d2d2d')
+        listbox_frame.pack(fill=tk.BOTH, expand=True)
+        
+        scrollbar = tk.Scrollbar(listbox_frame, bg='#374151', troughcolor='#2d2d2d')
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        listbox = self._app_listbox = tk.Listbox(listbox_frame, yscrollcommand=scrollbar.set,
+                            font=('Segoe UI', 10), bg='#2d2d2d', fg='#ffffff',
+                            selectbackground='#3b82f6', selectforeground='#ffffff',
+                            bd=0, highlightthickness=0, activestyle='none')
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=listbox.yview)
+        
+        self._app_search_var.trace('w', self._schedule_app_filter)
+        
+        
+        btn_frame = tk.Frame(app_window, bg='#1e1e1e')
+        btn_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        
+        select_btn = self._button(btn_frame, "Select Application", '#22c55e', self._select_app, padx=30)
+        select_btn.pack(side=tk.LEFT, expand=True)
+        
+        refresh_btn = self._button(btn_frame, "Refresh", '#374151', self._refresh_apps, padx=30)
+        refresh_btn.pack(side=tk.LEFT, expand=True)
+        
+        
+        listbox.bind('<Double-Button-1>', self._select_app)
+    
+    def _filter_apps(self):
+        """Filter applications based on search"""
+        self._app_filter_id = None
+        listbox = self._app_listbox
+        query = self._app_search_var.get().lower()
+        if query == self._app_query:
+            return
+        
+        narrowing = self._app_query is not None and query.startswith(self._app_query)
+        candidates = self._apps_shown if narrowing else range(len(self._all_apps_lower))
+        keep = [i for i in candidates if query in self._all_apps_lower[i]]
+        
+        if narrowing and len(keep) * 2 >= len(self._apps_shown):
+            # Most rows survive: delete each run of dropped rows with one call, bottom up
+            shown = self._apps_shown
+            run_end = None
+            for row in range(len(shown) - 1, -1, -1):
+                if query in self._all_apps_lower[shown[row]]:
+                    if run_end is not None:
+                        listbox.delete(row + 1, run_end)
+                        run_end = None
+                elif run_end is None:
+                    run_end = row
+            if run_end is not None:
+                listbox.delete(0, run_end)
+        else:
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, *[self._all_apps[i] for i in keep])
+        self._apps_shown = keep
+        self._app_query = query
+    
+    def _schedule_app_filter(self, *args):
+        """Debounce filtering while the user is typing"""
+        if self._app_filter_id is not None:
+            self._app_window.after_cancel(self._app_filter_id)
+        self._app_filter_id = self._app_window.after(80, self._filter_apps)
+    
+    def _select_app(self, event=None):
+        """Select application with animation"""
+        selection = self._app_listbox.curselection()
+        if selection:
+            selected_app = self._app_listbox.get(selection[0])
+            self.app_var.set(selected_app.lower())
+            
+            # Flash the selection once, then close without blocking the event loop
+            self._app_listbox.config(selectbackground='#22c55e')
+            self._app_window.after(180, self._hide_app_window)
+    
+    def _hide_app_window(self):
+        """Withdraw the picker so the next open can reuse it"""
+        self._app_listbox.config(selectbackground='#3b82f6')
+        self._app_listbox.selection_clear(0, tk.END)
+        self._app_window.grab_release()
+        self._app_window.withdraw()
+    
+    
+    def take_screenshot_animated(self):
+        """Take and send one screenshot"""
+        self.update_config()
+        success, message = self.bot.take_single_screenshot()
+        self.log_message_colored(message, 'success' if success else 'error')
+        if not success:
+            self.show_notification("Error", message, 'error')
+    
+    def start_monitoring_animated(self):
+        """Start monitoring and the status pulse"""
+        self.update_config()
+        success, message = self.bot.start_monitoring()
+        self.update_status()
+        self.log_message_colored(message, 'success' if success else 'error')
+        if not success:
+            self.show_notification("Error", message, 'error')
+        else:
+            self.start_pulse()
+            self.start_status_drain()
+            self.show_notification("Success", "Monitoring started!", 'success')
+    
+    def stop_monitoring_animated(self):
+        """Stop monitoring"""
+        success, message = self.bot.stop_monitoring()
+        self.update_status()
+        # Keep logging results the monitor thread reports while it winds down
+        self.start_status_drain()
+        self.log_message_colored(message, 'success' if success else 'warning')
+    
+    def _on_bot_status(self, success, message):
+        """Bot on_status hook; called from worker threads, so just queue the result"""
+        self._bot_status.put((success, message))
+    
+    def start_status_drain(self):
+        """Start logging monitoring results if the drain job isn't already running"""
+        if not self._status_drain_active:
+            self._status_drain_active = True
+            self.schedule_job(200, self._status_drain_step)
+    
+    def _status_drain_step(self):
+        """Log queued monitoring results every 200 ms until the bot's threads have exited"""
+        # Checked before draining so the final pass sees everything the threads queued
+        busy = self.bot.running or self.bot.monitor_busy
+        self._drain_bot_status()
+        if busy:
+            return 200
+        self._status_drain_active = False
+        return None
+    
+    def _drain_bot_status(self):
+        """Log every monitoring result queued by _on_bot_status"""
+        while True:
+            try:
+                success, message = self._bot_status.get_nowait()
+            except queue.Empty:
+                return
+            self.log_message_colored(message, 'success' if success else 'error')
+    
+    def show_notification(self, title, message, type_='info'):
+        """Show animated notification
+        
+        One borderless window is reused: each call recolours and repositions it
+        and restarts its 3 s timer.
+        """
+        bg = self.status_colors.get(type_, '#3b82f6')
+        if self._notification is None:
+            self._build_notification()
+        notification = self._notification
+        
+        for widget in (notification, *self._notification_widgets):
+            widget.config(bg=bg)
+        self._notification_title.config(text=title)
+        self._notification_msg.config(text=message)
+        
+        notification.geometry("400x120+{}+{}".format(
+            self.root.winfo_x() + self.root.winfo_width() - 420,
+            self.root.winfo_y() + 50
+        ))
+        notification.deiconify()
+        notification.lift()
+        
+        if self._notification_after_id is not None:
+            self.root.after_cancel(self._notification_after_id)
+        self._notification_after_id = self.root.after(3000, self._hide_notification)
+    
+    def _build_notification(self):
+        """Create the (initially hidden) notification window"""
+        notification = self._notification = tk.Toplevel(self.root)
+        notification.withdraw()
+        notification.resizable(False, False)
+        notification.overrideredirect(True)
+        
+        content_frame = tk.Frame(notification)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+        
+        self._notification_title = tk.Label(content_frame, font=('Segoe UI', 12, 'bold'),
+                                            fg='white')
+        self._notification_title.pack(anchor=tk.W)
+        
+        self._notification_msg = tk.Label(content_frame, font=('Segoe UI', 10),
+                                          fg='white', wraplength=350)
+        self._notification_msg.pack(anchor=tk.W, pady=(5, 0))
+        
+        self._notification_widgets = (content_frame, self._notification_title, self._notification_msg)
+    
+    def _hide_notification(self):
+        """Withdraw the notification so the next one can reuse it"""
+        self._notification_after_id = None
+        self._notification.withdraw()
+    
+    def _delete_on(self):
+        """Delete-after-send toggle switched on"""
+        self.delete_var.set(True)
+    
+    def _delete_off(self):
+        """Delete-after-send toggle switched off"""
+        self.delete_var.set(False)
+    
+    @staticmethod
+    def _valid_interval(proposed):
+        """Entry validatecommand: allow only an empty field or decimal digits"""
+        return proposed == '' or proposed.isdecimal()
+    
+    def update_config(self):
+        """Update bot configuration from GUI"""
+        self.bot.webhook_url = self.webhook_var.get().strip()
+        self.bot.app_name = self.app_var.get().strip().lower()
+        self.bot.custom_message = self.message_var.get().strip()
+        interval = int(self.interval_var.get() or 0)
+        if interval <= 0:
+            interval = 60
+            self.interval_var.set("60")
+        self.bot.interval = interval
+        self.bot.delete_after_send = self.delete_var.get()
+        self.update_status()
+    
+    def log_message_colored(self, message, type_='info'):
+        """Queue a colored message for the status log; written on the next idle cycle"""
+        self._log_buffer.append((self._timestamp(), message, type_))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+    
+    def _timestamp(self):
+        """Return the current HH:MM:SS string, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._ts_epoch:
+            self._ts_epoch = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._ts_str
+    
+    def _flush_log(self):
+        """Write all queued log messages with a single insert and scroll once"""
+        self._log_flush_scheduled = False
+        chunks = []
+        prefixes = self._LOG_PREFIX
+        info = prefixes['info']
+        for timestamp, message, type_ in self._log_buffer:
+            chunks += (f"[{timestamp}] ", "timestamp")
+            chunks += prefixes.get(type_, info)
+            chunks += (f"{message}\n", ())
+        self._log_buffer.clear()
+        
+        if chunks:
+            self.status_text.insert(tk.END, *chunks)
+            self._log_flushes += 1
+            if self._log_flushes % self.LOG_TRIM_EVERY == 0:
+                self._trim_log()
+            self.status_text.see(tk.END)
+    
+    def _trim_log(self):
+        """Drop the oldest lines once the status log grows past LOG_MAX_LINES"""
+        lines = int(self.status_text.index('end-1c').split('.')[0])
+        if lines > self.LOG_MAX_LINES:
+            self.status_text.delete('1.0', f'{lines - self.LOG_KEEP_LINES}.0')
+    
+    def update_status(self):
+        """Update status display, touching only the widgets whose state changed"""
+        running = self.bot.running
+        title_state = (bool(self.bot.webhook_url), bool(self.bot.app_name), self.bot.interval)
+        
+        if running != self._last_running:
+            self._last_running = running
+            self._apply_running_status(running)
+        
+        if title_state != self._last_title_state:
+            self._last_title_state = title_state
+            webhook_ok, app_ok, interval = title_state
+            webhook_status = "✓" if webhook_ok else "✗"
+            app_status = "✓" if app_ok else "✗"
+            status = f"Webhook: {webhook_status} | App: {app_status} | Interval: {interval}s"
+            self.root.title(f"Screenshot Discord Bot - {status}")
+    
+    def _apply_running_status(self, running):
+        """Configure the indicator and start/stop buttons for the monitoring state"""
+        if running:
+            self.status_indicator.itemconfig(self._status_dot, fill='#22c55e')
+            self.status_text_label.config(text="Monitoring Active", fg='#22c55e')
+            self.start_btn.config(state='disabled', text="Running...")
+            self.stop_btn.config(state='normal')
+        else:
+            self.status_indicator.itemconfig(self._status_dot, fill='#ef4444')
+            self.status_text_label.config(text="Stopped", fg='#ef4444')
+            self.start_btn.config(state='normal', text="Start Monitoring")
+            self.stop_btn.config(state='disabled')
+    
+    def run(self):
+        """Start the GUI with fade-in animation"""
+        
+        self.root.update_idletasks()
+        
+        
+        # Queued together, so the first idle flush writes them in one insert
+        self.log_message_colored("Welcome to Screenshot Discord Bot!", 'info')
+        if self.config_found:
+            self.log_message_colored("Config found, successfully loaded", 'success')
+        else:
+            self.log_message_colored("No previous configuration found. creating cfg.json", 'error')
+            self.log_message_colored("successfully created cfg file", 'success')
+        
+        self.root.mainloop()
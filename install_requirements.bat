@@ -5,7 +5,7 @@ color 0A
 echo Installing Python dependencies for Screenshot Discord Bot...
 echo.
 
-pip install --upgrade requests pyautogui psutil Pillow pygetwindow pywin32
+pip install --upgrade requests pyautogui "psutil>=5.9.6" Pillow pygetwindow pywin32 numpy simplejpeg mss
 
 if %errorlevel%==0 (
     echo.
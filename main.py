@@ -7,12 +7,23 @@ Enhanced with customizable messages and persistent configuration
 """
 
 import os
+import io
 import time
 import requests
+from urllib3.util.retry import Retry
 from datetime import datetime
 import sys
 import threading
+import queue
 import json
+import functools
+import itertools
+import re
+import contextlib
+import collections
+import concurrent.futures
+import string
+import importlib.util
 
 
 try:
@@ -20,16 +31,40 @@ try:
     import psutil
 except ImportError as e:
     print(f"Missing required package: {e}")
-    print("Install with: pip install pyautogui psutil")
+    print("Install with: pip install pyautogui \"psutil>=5.9.6\"")
     sys.exit(1)
 
 
 try:
-    import tkinter as tk
-    from tkinter import ttk, messagebox, scrolledtext
-    GUI_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    GUI_AVAILABLE = False
+    NUMPY_AVAILABLE = False
+
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+try:
+    import simplejpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+
+# tkinter is only imported (via gui.py) once the GUI is actually chosen
+GUI_AVAILABLE = importlib.util.find_spec('tkinter') is not None
 
 
 if sys.platform == "win32":
@@ -38,11 +73,24 @@ if sys.platform == "win32":
         import win32gui
         import win32ui
         import win32con
+        import ctypes
+        from ctypes import wintypes
         from PIL import Image
     except ImportError as e:
         print(f"Missing Windows-specific package: {e}")
         print("Install with: pip install pygetwindow pywin32 Pillow")
         sys.exit(1)
+    
+    # Called directly so bitmap bits land in a reused buffer instead of a new bytes object
+    _GetBitmapBits = ctypes.windll.gdi32.GetBitmapBits
+    _GetBitmapBits.argtypes = (wintypes.HBITMAP, wintypes.LONG, ctypes.c_void_p)
+    _GetBitmapBits.restype = wintypes.LONG
+    
+    # Renders a window into a DC even when occluded, including DWM/DirectX content
+    PW_RENDERFULLCONTENT = 0x00000002
+    _PrintWindow = ctypes.windll.user32.PrintWindow
+    _PrintWindow.argtypes = (wintypes.HWND, wintypes.HDC, wintypes.UINT)
+    _PrintWindow.restype = wintypes.BOOL
 
 
 elif sys.platform == "darwin":
@@ -64,59 +112,150 @@ else:
         print(f"Missing Linux-specific package: {e}")
         print("Install with: pip install Pillow")
         sys.exit(1)
+    
+    try:
+        from Xlib import display as xdisplay, X, error as xerror
+        XLIB_AVAILABLE = True
+    except ImportError:
+        XLIB_AVAILABLE = False
 
-class ToggleSwitch(tk.Canvas):
-    """
-    A custom tkinter widget that acts as a sliding toggle switch with rounded edges.
+PROCESS_CACHE_TTL = 5
+
+
+@functools.lru_cache(maxsize=1)
+def _snapshot_processes(bucket):
+    """Snapshot running processes as (pid, name) tuples, cached per TTL bucket"""
+    processes = []
+    for proc in psutil.process_iter(['pid', 'name']):
+        name = proc.info['name']
+        if name:
+            processes.append((proc.info['pid'], name))
+    return tuple(processes)
+
+
+def running_processes():
+    """Return the cached process snapshot, refreshed every PROCESS_CACHE_TTL seconds"""
+    return _snapshot_processes(int(time.monotonic() // PROCESS_CACHE_TTL))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _bgrx_to_rgb(src, dst):
+        """Unpack a flat BGRX byte buffer into an (h, w, 3) RGB array"""
+        height, width = dst.shape[0], dst.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                o = (y * width + x) * 4
+                dst[y, x, 0] = src[o + 2]
+                dst[y, x, 1] = src[o + 1]
+                dst[y, x, 2] = src[o]
+
+
+def _warm_bgrx_to_rgb():
+    """Compile (or load from cache) the numba kernel before the first real capture
+    
+    numba specializes on writability: mss/Xlib hand over read-only bytes, the
+    Windows GDI path its reused bytearray, so both signatures are warmed.
     """
-    def __init__(self, master, on_command=None, off_command=None, **kwargs):
-        super().__init__(master, width=50, height=26, highlightthickness=0, **kwargs)
-        self.on_color = '#22c55e'
-        self.off_color = '#6b7280'
-        self.toggle_color = '#ffffff'
-        self.state = False
-        self.on_command = on_command
-        self.off_command = off_command
-        
-        self.bind('<Button-1>', self.toggle)
-        self.draw_toggle()
+    for src in (bytes(4), bytearray(4)):
+        _bgrx_to_rgb(np.frombuffer(src, dtype=np.uint8), np.empty((1, 1, 3), dtype=np.uint8))
 
-    def draw_toggle(self):
-        """Draws the toggle switch based on its current state."""
-        self.delete('all')
-        bg_color = self.on_color if self.state else self.off_color
-        
-        # Draw the rounded rectangle background
-        self.create_oval(2, 2, 24, 24, fill=bg_color, outline=bg_color)
-        self.create_oval(26, 2, 48, 24, fill=bg_color, outline=bg_color)
-        self.create_rectangle(12, 2, 38, 24, fill=bg_color, outline=bg_color)
-        
-        # Draw the knob as a perfect circle
-        if self.state:
-            self.create_oval(28, 2, 48, 24, fill=self.toggle_color, outline=self.toggle_color)
-        else:
-            self.create_oval(2, 2, 22, 24, fill=self.toggle_color, outline=self.toggle_color)
 
-    def toggle(self, event=None):
-        """Toggles the state of the switch and executes the corresponding command."""
-        self.state = not self.state
-        self.draw_toggle()
-        if self.state and self.on_command:
-            self.on_command()
-        elif not self.state and self.off_command:
-            self.off_command()
+class WindowObj:
+    """
+    Minimal pygetwindow-compatible wrapper around a raw Win32 window handle.
+    """
+    def __init__(self, hwnd, title, rect):
+        self.hwnd = hwnd
+        self.title = title
+        self.left = rect[0]
+        self.top = rect[1]
+        self.width = rect[2] - rect[0]
+        self.height = rect[3] - rect[1]
+        self.visible = True
+        
+    @property
+    def isMinimized(self):
+        return win32gui.IsIconic(self.hwnd)
+        
+    def restore(self):
+        win32gui.ShowWindow(self.hwnd, win32con.SW_RESTORE)
+        
+    def activate(self):
+        win32gui.SetForegroundWindow(self.hwnd)
 
 
 class ApplicationScreenshotter:
+    # strftime formats for the time-based message variables
+    MESSAGE_TIME_FORMATS = {
+        'timestamp': "%Y-%m-%d %H:%M:%S",
+        'date': "%Y-%m-%d",
+        'time': "%H:%M:%S",
+        'day': "%A",
+        'month': "%B",
+        'year': "%Y"
+    }
+    # Frames whose dHash differs by fewer bits than this count as unchanged
+    UNCHANGED_HASH_DISTANCE = 3
+    # Discord accepts at most 10 attachments per webhook message
+    MAX_ATTACHMENTS = 10
+    # Longest a batched screenshot may wait for the rest of its batch, in seconds
+    BATCH_MAX_DELAY = 300
+    # Uploads allowed to wait for the uploader thread before capture blocks
+    UPLOAD_BACKLOG = 4
+    # Times a webhook POST is re-sent after a 429 before the upload fails
+    RATELIMIT_RETRIES = 3
+    # Windows whose capture DC/bitmap are kept between screenshots
+    GDI_POOL_SIZE = 4
+    # image_format -> (file extension, PIL format, MIME type)
+    IMAGE_FORMATS = {
+        'jpeg': ('.jpg', 'JPEG', 'image/jpeg'),
+        'png': ('.png', 'PNG', 'image/png'),
+        'webp': ('.webp', 'WEBP', 'image/webp'),
+    }
+    
     def __init__(self):
         self.config_file = "cfg.json"
+        # Serialized settings as last loaded/written; None until the file has been touched
+        self._saved_config = None
         self.webhook_url = ""
         self.app_name = ""
         self.interval = 60
         self.delete_after_send = True
+        self.skip_unchanged = True
+        self.batch_size = 1
         self.custom_message = "Screenshot of {app_name} - {timestamp}"
+        self.image_format = 'jpeg'
+        self.jpeg_quality = 85
         self.running = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
+        self._thread_local = threading.local()
+        self._last_hash = None
+        self._dir_ensured = False
+        self._pending = []
+        self._pending_hash = None
+        self._pending_deadline = 0.0
+        self._gdi_cache = collections.OrderedDict()
+        self._gdi_lock = threading.Lock()
+        self._pixel_buf = None
+        self._cached_window = None
+        # Deletes run here so an antivirus/indexer-delayed unlink doesn't stall capture
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='screenshot-io')
+        self._session = self._create_session()
+        # webhook URL -> monotonic() time before which its rate-limit bucket is empty
+        self._ratelimit_until = {}
+        # Optional callable(success, message) for results from the monitoring threads
+        self.on_status = None
+        # Platform-specific window lookup and capture, picked once instead of per call
+        if sys.platform == "win32":
+            self._find_impl, self._screenshot_impl = self._find_window_windows, self._screenshot_windows
+        elif sys.platform == "darwin":
+            self._find_impl, self._screenshot_impl = self._find_window_macos, self._screenshot_macos
+        else:
+            self._find_impl, self._screenshot_impl = self._find_window_linux, self._screenshot_linux
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=_warm_bgrx_to_rgb, daemon=True).start()
         
         
     def load_config(self):
@@ -129,7 +268,12 @@ class ApplicationScreenshotter:
                     self.app_name = config.get('app_name', '')
                     self.interval = config.get('interval', 60)
                     self.delete_after_send = config.get('delete_after_send', True)
+                    self.skip_unchanged = config.get('skip_unchanged', True)
+                    self.batch_size = config.get('batch_size', 1)
+                    image_format = config.get('image_format', 'jpeg')
+                    self.image_format = image_format if image_format in self.IMAGE_FORMATS else 'jpeg'
                     self.custom_message = config.get('custom_message', 'Screenshot of {app_name} - {timestamp}')
+                self._saved_config = self._serialize_config()
                 return True # Config loaded
             else:
                 self.create_default_config()
@@ -139,63 +283,173 @@ class ApplicationScreenshotter:
             self.create_default_config()
             return False # Error, so created default config
             
+    def _config_dict(self):
+        """Collect the persisted settings into a dict"""
+        return {
+            'webhook_url': self.webhook_url,
+            'app_name': self.app_name,
+            'interval': self.interval,
+            'delete_after_send': self.delete_after_send,
+            'skip_unchanged': self.skip_unchanged,
+            'batch_size': self.batch_size,
+            'image_format': self.image_format,
+            'custom_message': self.custom_message
+        }
+    
+    def _serialize_config(self):
+        """Serialize the configuration to compact JSON bytes"""
+        return json.dumps(self._config_dict(), separators=(',', ':')).encode()
+            
     def create_default_config(self):
         """Create a default configuration file"""
         try:
-            config = {
-                'webhook_url': self.webhook_url,
-                'app_name': self.app_name,
-                'interval': self.interval,
-                'delete_after_send': self.delete_after_send,
-                'custom_message': self.custom_message
-            }
             with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+                json.dump(self._config_dict(), f, indent=2)
+            self._saved_config = self._serialize_config()
         except Exception as e:
             print(f"Error creating default config: {e}")
             
+    @property
+    def config_dirty(self):
+        """True if settings changed since they were last loaded or saved"""
+        return self._serialize_config() != self._saved_config
+    
     def save_config(self):
-        """Save configuration to JSON file"""
+        """Save configuration to JSON file, skipping the write if nothing changed"""
         try:
-            config = {
-                'webhook_url': self.webhook_url,
-                'app_name': self.app_name,
-                'interval': self.interval,
-                'delete_after_send': self.delete_after_send,
-                'custom_message': self.custom_message
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            data = self._serialize_config()
+            if data == self._saved_config:
+                return
+            try:
+                with open(self.config_file, 'rb') as f:
+                    if f.read() == data:
+                        self._saved_config = data
+                        return
+            except FileNotFoundError:
+                pass
+            
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+            self._saved_config = data
         except Exception as e:
             print(f"Error saving config: {e}")
     
-    def format_message(self):
-        """Format the custom message with available variables"""
-        variables = {
-            'app_name': self.app_name,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'date': datetime.now().strftime("%Y-%m-%d"),
-            'time': datetime.now().strftime("%H:%M:%S"),
-            'day': datetime.now().strftime("%A"),
-            'month': datetime.now().strftime("%B"),
-            'year': datetime.now().strftime("%Y")
-        }
+    @property
+    def webhook_url(self):
+        return self._webhook_url
+    
+    @webhook_url.setter
+    def webhook_url(self, url):
+        """Store the webhook setting; several URLs separated by commas/whitespace are used round-robin"""
+        self._webhook_url = url
+        self.webhook_urls = [u for u in re.split(r'[\s,]+', url) if u]
+        self._url_cycle = itertools.cycle(self.webhook_urls)
+    
+    @property
+    def app_name(self):
+        return self._app_name
+    
+    @app_name.setter
+    def app_name(self, name):
+        """Store the target name along with its case-folded form used for matching"""
+        if name != getattr(self, '_app_name', None):
+            # A newly chosen target may have just been launched; don't match against a stale snapshot
+            _snapshot_processes.cache_clear()
+            self._cached_window = None
+        self._app_name = name
+        self._app_name_lc = name.casefold()
+    
+    @property
+    def custom_message(self):
+        return self._custom_message
+    
+    @custom_message.setter
+    def custom_message(self, message):
+        """Store the message template and precompute which variables it uses"""
+        self._custom_message = message
+        self._msg_keys = self._message_keys(message)
+    
+    @staticmethod
+    def _message_keys(message):
+        """Return the set of variable names referenced by a message template
+        
+        Only the leading name of a field counts, so {timestamp[0]} and
+        {date.year} both refer to their base variable.
+        """
+        keys = set()
+        try:
+            for _, field, _, _ in string.Formatter().parse(message):
+                match = field and re.match(r'\w+', field)
+                if match:
+                    keys.add(match.group())
+        except ValueError:
+            # Malformed template; format_message reports the error
+            pass
+        return keys
+    
+    def format_message(self, message=None):
+        """Format the custom message, or the given template, with available variables"""
+        if message is None:
+            message, keys = self.custom_message, self._msg_keys
+        else:
+            keys = self._message_keys(message)
+        
+        now = datetime.now()
+        variables = {'app_name': self.app_name}
+        variables.update({key: now.strftime(self.MESSAGE_TIME_FORMATS[key])
+                          for key in keys if key in self.MESSAGE_TIME_FORMATS})
         
         try:
-            return self.custom_message.format(**variables)
+            return message.format(**variables)
         except KeyError as e:
             return f"Error in message format: Unknown variable {e}"
         except Exception as e:
             return f"Error formatting message: {e}"
     
     def find_application_window(self):
-        """Find the application window based on platform"""
+        """Find the application window based on platform
+        
+        The last window found is reused while a cheap check says it is still valid,
+        so monitoring doesn't rescan every window on each capture.
+        """
+        window = self._cached_window
+        if window is not None:
+            try:
+                window = self._revalidate_window(window)
+            except Exception:
+                window = None
+            if window is not None:
+                self._cached_window = window
+                return window
+        
+        window = self._cached_window = self._find_impl()
+        return window
+    
+    def _revalidate_window(self, window):
+        """Return the cached window (refreshed if needed) if it still matches, else None"""
+        app_name_lc = self._app_name_lc
         if sys.platform == "win32":
-            return self._find_window_windows()
+            hwnd = getattr(window, 'hwnd', None) or getattr(window, '_hWnd', None)
+            if (not hwnd or not win32gui.IsWindow(hwnd) or
+                    not win32gui.IsWindowVisible(hwnd) or win32gui.IsIconic(hwnd)):
+                return None
+            if isinstance(window, WindowObj):
+                # Found via its process; only the rect can have gone stale
+                return WindowObj(hwnd, win32gui.GetWindowText(hwnd), win32gui.GetWindowRect(hwnd))
+            return window if app_name_lc in window.title.casefold() else None
         elif sys.platform == "darwin":
-            return self._find_window_macos()
+            return None if window.isTerminated() else window
         else:
-            return self._find_window_linux()
+            disp = self._get_xdisplay()
+            if disp:
+                name = disp.create_resource_object('window', int(window)).get_wm_name()
+            else:
+                result = subprocess.run(['xdotool', 'getwindowname', window],
+                                        capture_output=True, text=True)
+                name = result.stdout if result.returncode == 0 else None
+            return window if isinstance(name, str) and app_name_lc in name.casefold() else None
     
     def _find_window_windows(self):
         """Find application window on Windows"""
@@ -204,9 +458,11 @@ class ApplicationScreenshotter:
             windows = gw.getAllWindows()
             matching_windows = []
             
+            app_name_lc = self._app_name_lc
             for window in windows:
-                if (window.title and 
-                    self.app_name in window.title.lower() and 
+                title = window.title
+                if (title and 
+                    app_name_lc in title.casefold() and 
                     window.visible and 
                     window.width > 0 and window.height > 0):
                     matching_windows.append(window)
@@ -219,56 +475,21 @@ class ApplicationScreenshotter:
                 return matching_windows[0]  
             
             
-            for proc in psutil.process_iter(['name', 'pid']):
-                try:
-                    proc_name = proc.info['name'].lower()
-                    if self.app_name in proc_name or proc_name.replace('.exe', '') == self.app_name:
-                        
-                        def enum_windows_callback(hwnd, pid):
-                            if win32gui.GetWindowThreadProcessId(hwnd)[1] == pid:
-                                window_title = win32gui.GetWindowText(hwnd)
-                                if window_title and win32gui.IsWindowVisible(hwnd):
-                                    
-                                    rect = win32gui.GetWindowRect(hwnd)
-                                    class WindowObj:
-                                        def __init__(self, hwnd, title, rect):
-                                            self.hwnd = hwnd
-                                            self.title = title
-                                            self.left = rect[0]
-                                            self.top = rect[1] 
-                                            self.width = rect[2] - rect[0]
-                                            self.height = rect[3] - rect[1]
-                                            self.visible = True
-                                            
-                                        @property
-                                        def isMinimized(self):
-                                            return win32gui.IsIconic(self.hwnd)
-                                            
-                                        def restore(self):
-                                            win32gui.ShowWindow(self.hwnd, win32con.SW_RESTORE)
-                                            
-                                        def activate(self):
-                                            win32gui.SetForegroundWindow(self.hwnd)
-                                    
-                                    return WindowObj(hwnd, window_title, rect)
-                            return None
-                        
-                        
-                        def callback(hwnd, pid):
-                            result = enum_windows_callback(hwnd, pid)
-                            if result:
-                                callback.result = result
-                                return False
-                            return True
-                        
-                        callback.result = None
-                        win32gui.EnumWindows(lambda hwnd, param: callback(hwnd, proc.info['pid']), None)
-                        
-                        if hasattr(callback, 'result') and callback.result:
-                            return callback.result
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            pid_to_hwnds = {}
+            
+            def collect_window(hwnd, acc):
+                acc.setdefault(win32gui.GetWindowThreadProcessId(hwnd)[1], []).append(hwnd)
+                return True
+            
+            win32gui.EnumWindows(collect_window, pid_to_hwnds)
+            
+            for pid, proc_name in running_processes():
+                proc_name = proc_name.casefold()
+                if app_name_lc in proc_name or proc_name.removesuffix('.exe') == app_name_lc:
+                    for hwnd in pid_to_hwnds.get(pid, []):
+                        window_title = win32gui.GetWindowText(hwnd)
+                        if window_title and win32gui.IsWindowVisible(hwnd):
+                            return WindowObj(hwnd, window_title, win32gui.GetWindowRect(hwnd))
                     
         except Exception as e:
             print(f"Error finding window on Windows: {e}")
@@ -279,15 +500,39 @@ class ApplicationScreenshotter:
         try:
             workspace = NSWorkspace.sharedWorkspace()
             apps = workspace.runningApplications()
+            app_name_lc = self._app_name_lc
             for app in apps:
-                if self.app_name in app.localizedName().lower():
+                if app_name_lc in app.localizedName().casefold():
                     return app
         except Exception as e:
             print(f"Error finding window on macOS: {e}")
         return None
     
+    def _get_xdisplay(self):
+        """Return this thread's persistent X11 connection, or None if python-xlib can't be used
+        
+        python-xlib connections aren't thread-safe, so the Tk thread and the
+        monitor thread each get their own, like _get_mss.
+        """
+        disp = getattr(self._thread_local, 'xdisp', None)
+        if disp is None:
+            disp = self._thread_local.xdisp = False
+            if XLIB_AVAILABLE:
+                try:
+                    disp = self._thread_local.xdisp = xdisplay.Display()
+                except Exception as e:
+                    print(f"Could not open X display, falling back to xdotool: {e}")
+        return disp or None
+    
     def _find_window_linux(self):
         """Find application window on Linux"""
+        disp = self._get_xdisplay()
+        if disp:
+            try:
+                return self._find_window_x11(disp)
+            except Exception as e:
+                print(f"X11 window search failed, falling back to xdotool: {e}")
+        
         try:
             result = subprocess.run(['xdotool', 'search', '--name', self.app_name], 
                                   capture_output=True, text=True)
@@ -297,6 +542,35 @@ class ApplicationScreenshotter:
             print(f"Error finding window on Linux: {e}")
         return None
     
+    def _find_window_x11(self, disp):
+        """Breadth-first search of the X11 window tree for a matching window name"""
+        app_name_lc = self._app_name_lc
+        pending = list(disp.screen().root.query_tree().children)
+        while pending:
+            next_level = []
+            for window in pending:
+                try:
+                    name = window.get_wm_name()
+                    if isinstance(name, str) and app_name_lc in name.casefold():
+                        return str(window.id)
+                    next_level.extend(window.query_tree().children)
+                except xerror.XError:
+                    # Windows are routinely destroyed while the tree is being walked
+                    continue
+            pending = next_level
+        return None
+    
+    def _activate_window_linux(self, window_id):
+        """Raise and focus a window, over the X11 connection when available"""
+        disp = self._get_xdisplay()
+        if disp:
+            window = disp.create_resource_object('window', int(window_id))
+            window.configure(stack_mode=X.Above)
+            window.set_input_focus(X.RevertToParent, X.CurrentTime)
+            disp.sync()
+        else:
+            subprocess.run(['xdotool', 'windowactivate', window_id], check=True)
+    
     def list_running_applications(self):
         """List running applications to help user choose"""
         apps = set()
@@ -310,15 +584,7 @@ class ApplicationScreenshotter:
             except:
                 pass
             
-            for proc in psutil.process_iter(['name']):
-                try:
-                    name = proc.info['name']
-                    if name and not name.endswith('.exe'):
-                        apps.add(name)
-                    elif name and name.endswith('.exe'):
-                        apps.add(name[:-4])  
-                except:
-                    pass
+            apps.update(name.removesuffix('.exe') for pid, name in running_processes() if name)
                     
         elif sys.platform == "darwin":
             try:
@@ -330,13 +596,9 @@ class ApplicationScreenshotter:
                 pass
                 
         else:  
-            for proc in psutil.process_iter(['name']):
-                try:
-                    apps.add(proc.info['name'])
-                except:
-                    pass
+            apps.update(name for pid, name in running_processes())
         
-        return sorted([app for app in apps if app and len(app) > 1])
+        return sorted(app for app in apps if app and len(app) > 1)
     
     def take_screenshot(self):
         """Take screenshot of the application"""
@@ -346,29 +608,83 @@ class ApplicationScreenshotter:
         
         
         screenshots_dir = "screenshots"
-        if not os.path.exists(screenshots_dir):
-            os.makedirs(screenshots_dir)
+        if not self._dir_ensured:
+            os.makedirs(screenshots_dir, exist_ok=True)
+            self._dir_ensured = True
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(screenshots_dir, f"screenshot_{self.app_name}_{timestamp}.png")
+        ext = self.IMAGE_FORMATS[self.image_format][0]
+        filename = os.path.join(screenshots_dir, f"screenshot_{self.app_name}_{timestamp}{ext}")
         
         try:
-            if sys.platform == "win32":
-                return self._screenshot_windows(window, filename)
-            elif sys.platform == "darwin":
-                return self._screenshot_macos(window, filename)
-            else:
-                return self._screenshot_linux(window, filename)
+            payload, message = self._screenshot_impl(window, filename)
         except Exception as e:
-            return None, f"Error taking screenshot: {e}"
+            payload, message = None, f"Error taking screenshot: {e}"
+        if payload is None:
+            # Force a fresh window search next time
+            self._cached_window = None
+        return payload, message
+    
+    def _gdi_surface(self, hwnd, width, height):
+        """Return pooled (mfcDC, saveDC, saveBitMap) for capturing hwnd at this size
+        
+        DCs and bitmaps are kept between captures and only recreated when the
+        window's size changes; the least recently used of GDI_POOL_SIZE windows
+        is released when the pool is full. Call with _gdi_lock held.
+        """
+        entry = self._gdi_cache.get(hwnd)
+        if entry is not None:
+            if entry[0] == (width, height):
+                self._gdi_cache.move_to_end(hwnd)
+                return entry[2:]
+            self._release_gdi(hwnd)
+        
+        hwndDC = win32gui.GetWindowDC(hwnd)
+        mfcDC = win32ui.CreateDCFromHandle(hwndDC)
+        saveDC = mfcDC.CreateCompatibleDC()
+        saveBitMap = win32ui.CreateBitmap()
+        saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
+        saveDC.SelectObject(saveBitMap)
+        
+        self._gdi_cache[hwnd] = ((width, height), hwndDC, mfcDC, saveDC, saveBitMap)
+        if len(self._gdi_cache) > self.GDI_POOL_SIZE:
+            self._release_gdi(next(iter(self._gdi_cache)))
+        return mfcDC, saveDC, saveBitMap
+    
+    def _pixel_buffer(self, size):
+        """Return the reusable capture buffer, reallocated only when the frame size changes"""
+        if self._pixel_buf is None or len(self._pixel_buf) != size:
+            self._pixel_buf = bytearray(size)
+        return self._pixel_buf
+    
+    def _release_gdi(self, hwnd=None):
+        """Free the pooled GDI objects for one window, or for all windows"""
+        hwnds = list(self._gdi_cache) if hwnd is None else [hwnd]
+        for hwnd in hwnds:
+            entry = self._gdi_cache.pop(hwnd, None)
+            if entry is None:
+                continue
+            _, hwndDC, mfcDC, saveDC, saveBitMap = entry
+            try:
+                win32gui.DeleteObject(saveBitMap.GetHandle())
+                saveDC.DeleteDC()
+                mfcDC.DeleteDC()
+                win32gui.ReleaseDC(hwnd, hwndDC)
+            except Exception:
+                pass
     
     def _screenshot_windows(self, window, filename):
         """Take screenshot on Windows"""
         try:
             
             try:
-                hwnd = win32gui.FindWindow(None, window.title)
+                hwnd = (getattr(window, 'hwnd', None) or getattr(window, '_hWnd', None) or
+                        win32gui.FindWindow(None, window.title))
                 if hwnd:
+                    if win32gui.IsIconic(hwnd):
+                        # A minimized window has nothing to render; restore it without taking focus
+                        win32gui.ShowWindow(hwnd, win32con.SW_SHOWNOACTIVATE)
+                        time.sleep(0.3)
                     
                     rect = win32gui.GetWindowRect(hwnd)
                     left, top, right, bottom = rect
@@ -376,48 +692,26 @@ class ApplicationScreenshotter:
                     height = bottom - top
                     
                     
-                    win32gui.SetForegroundWindow(hwnd)
-                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                    time.sleep(1)  
-                    
-                    
-                    hwndDC = win32gui.GetWindowDC(hwnd)
-                    mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-                    saveDC = mfcDC.CreateCompatibleDC()
-                    
-                    
-                    saveBitMap = win32ui.CreateBitmap()
-                    saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-                    saveDC.SelectObject(saveBitMap)
-                    
-                    
-                    result = saveDC.BitBlt((0, 0), (width, height), mfcDC, (0, 0), win32con.SRCCOPY)
-                    
-                    if result:
-                        
-                        bmpinfo = saveBitMap.GetInfo()
-                        bmpstr = saveBitMap.GetBitmapBits(True)
-                        
-                        img = Image.frombuffer(
-                            'RGB',
-                            (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                            bmpstr, 'raw', 'BGRX', 0, 1)
+                    # Held through encoding: the pixel buffer is shared between captures
+                    with self._gdi_lock:
+                        try:
+                            mfcDC, saveDC, saveBitMap = self._gdi_surface(hwnd, width, height)
+                            if not _PrintWindow(hwnd, saveDC.GetSafeHdc(), PW_RENDERFULLCONTENT):
+                                # PrintWindow unsupported here: copy from screen, which needs the window on top
+                                win32gui.SetForegroundWindow(hwnd)
+                                time.sleep(1)
+                                saveDC.BitBlt((0, 0), (width, height), mfcDC, (0, 0), win32con.SRCCOPY)
+                            bmpstr = self._pixel_buffer(width * height * 4)
+                            if not _GetBitmapBits(saveBitMap.GetHandle(), len(bmpstr),
+                                                  ctypes.addressof((ctypes.c_char * len(bmpstr)).from_buffer(bmpstr))):
+                                raise ctypes.WinError()
+                        except Exception:
+                            # Stale DC (window closed/recreated); drop it and fall back
+                            self._release_gdi(hwnd)
+                            raise
                         
-                        
-                        win32gui.DeleteObject(saveBitMap.GetHandle())
-                        saveDC.DeleteDC()
-                        mfcDC.DeleteDC()
-                        win32gui.ReleaseDC(hwnd, hwndDC)
-                        
-                        
-                        img.save(filename)
-                        return filename, "✓ Used direct window capture method"
-                    
-                    
-                    win32gui.DeleteObject(saveBitMap.GetHandle())
-                    saveDC.DeleteDC()
-                    mfcDC.DeleteDC()
-                    win32gui.ReleaseDC(hwnd, hwndDC)
+                        payload = self._encode_bgrx(bmpstr, width, height, filename)
+                    return payload, "✓ Used direct window capture method"
                     
             except Exception as e:
                 pass
@@ -432,9 +726,8 @@ class ApplicationScreenshotter:
             left, top, width, height = window.left, window.top, window.width, window.height
             
             
-            if width <= 0 or height <= 0:
-                screenshot = pyautogui.screenshot()
-            else:
+            region = None
+            if width > 0 and height > 0:
                 
                 margin = 8
                 left += margin
@@ -443,12 +736,9 @@ class ApplicationScreenshotter:
                 height -= margin * 2 + 30
                 
                 if width > 0 and height > 0:
-                    screenshot = pyautogui.screenshot(region=(left, top, width, height))
-                else:
-                    screenshot = pyautogui.screenshot()
+                    region = (left, top, width, height)
             
-            screenshot.save(filename)
-            return filename, "✓ Used screen region capture method"
+            return self._capture_screen(filename, region), "✓ Used screen region capture method"
             
         except Exception as e:
             return None, f"Error in Windows screenshot: {e}"
@@ -466,9 +756,9 @@ class ApplicationScreenshotter:
                 options = Quartz.kCGWindowListOptionOnScreenOnly
                 window_list = Quartz.CGWindowListCopyWindowInfo(options, Quartz.kCGNullWindowID)
                 
-                app_name = app.localizedName().lower()
+                app_name = app.localizedName().casefold()
                 for window in window_list:
-                    window_owner = window.get('kCGWindowOwnerName', '').lower()
+                    window_owner = window.get('kCGWindowOwnerName', '').casefold()
                     if app_name in window_owner:
                         bounds = window.get('kCGWindowBounds', {})
                         if bounds:
@@ -478,43 +768,102 @@ class ApplicationScreenshotter:
                             height = int(bounds['Height'])
                             
                             if width > 0 and height > 0:
-                                screenshot = pyautogui.screenshot(region=(x, y, width, height))
-                                screenshot.save(filename)
-                                return filename, "✓ Used window bounds capture method"
+                                payload = self._capture_quartz_window(window.get('kCGWindowNumber'), filename)
+                                if payload:
+                                    return payload, "✓ Used direct window capture method"
+                                
+                                region = (x, y, width, height)
+                                return self._capture_screen(filename, region), "✓ Used window bounds capture method"
             except Exception as e:
                 pass
             
             
-            screenshot = pyautogui.screenshot()
-            screenshot.save(filename)
-            return filename, "✓ Used full screen capture method"
+            return self._capture_screen(filename), "✓ Used full screen capture method"
             
         except Exception as e:
             return None, f"Error in macOS screenshot: {e}"
     
+    def _capture_quartz_window(self, window_number, filename):
+        """Render a single macOS window with Quartz, without compositing the whole screen"""
+        if window_number is None:
+            return None
+        image_ref = Quartz.CGWindowListCreateImage(
+            Quartz.CGRectNull,
+            Quartz.kCGWindowListOptionIncludingWindow,
+            window_number,
+            Quartz.kCGWindowImageBoundsIgnoreFraming)
+        if image_ref is None:
+            return None
+        
+        width = Quartz.CGImageGetWidth(image_ref)
+        height = Quartz.CGImageGetHeight(image_ref)
+        if width <= 0 or height <= 0:
+            return None
+        bytes_per_row = Quartz.CGImageGetBytesPerRow(image_ref)
+        data = Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(image_ref))
+        
+        # Quartz hands back BGRA rows that may be padded, so unpack with the real stride
+        img = Image.frombuffer('RGB', (width, height), bytes(data), 'raw', 'BGRX', bytes_per_row, 1)
+        return self._save_image(img, filename)
+    
+    def _capture_x11_window(self, disp, window_id, filename):
+        """Read a window's pixels straight over the X11 connection, or None if unsupported"""
+        window = disp.create_resource_object('window', int(window_id))
+        geom = window.get_geometry()
+        width, height = geom.width, geom.height
+        # 24/32-bit visuals come back as packed BGRX in ZPixmap format
+        if geom.depth not in (24, 32) or width <= 0 or height <= 0:
+            return None
+        raw = window.get_image(0, 0, width, height, X.ZPixmap, 0xffffffff)
+        if len(raw.data) != width * height * 4:
+            return None
+        return self._encode_bgrx(raw.data, width, height, filename)
+    
     def _screenshot_linux(self, window_id, filename):
         """Take screenshot on Linux"""
         try:
             
+            # Raise the window once; every window-based method below shares the wait
             try:
-                subprocess.run(['xdotool', 'windowactivate', window_id], check=True)
+                self._activate_window_linux(window_id)
                 time.sleep(1)
-                result = subprocess.run(['import', '-window', window_id, filename], 
-                                      check=True, capture_output=True, text=True)
-                if os.path.exists(filename):
-                    return filename, "✓ Used window ID capture method"
-            except subprocess.CalledProcessError:
-                pass
-            
+                activated = True
+            except Exception:
+                activated = False
             
-            try:
-                subprocess.run(['xdotool', 'windowactivate', window_id], check=True)
-                time.sleep(1)
-                result = subprocess.run(['scrot', '-s', filename], check=True)
-                if os.path.exists(filename):
-                    return filename, "✓ Used scrot selection method"
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            if activated:
+                disp = self._get_xdisplay()
+                if disp:
+                    try:
+                        payload = self._capture_x11_window(disp, window_id, filename)
+                        if payload is not None:
+                            return payload, "✓ Used X11 window capture method"
+                    except Exception:
+                        pass
+                
+                try:
+                    if self.delete_after_send:
+                        # ImageMagick writes the image to stdout, so nothing touches disk
+                        magick_format = self.IMAGE_FORMATS[self.image_format][0][1:]
+                        result = subprocess.run(['import', '-window', window_id, f'{magick_format}:-'], 
+                                              check=True, capture_output=True)
+                        if result.stdout:
+                            return self._memory_file(result.stdout, filename), "✓ Used window ID capture method"
+                    else:
+                        result = subprocess.run(['import', '-window', window_id, filename], 
+                                              check=True, capture_output=True, text=True)
+                        if os.path.exists(filename):
+                            return filename, "✓ Used window ID capture method"
+                except subprocess.CalledProcessError:
+                    pass
+                
+                
+                try:
+                    result = subprocess.run(['scrot', '-s', filename], check=True)
+                    if os.path.exists(filename):
+                        return filename, "✓ Used scrot selection method"
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    pass
             
             
             try:
@@ -525,62 +874,415 @@ class ApplicationScreenshotter:
                 pass
             
             
-            screenshot = pyautogui.screenshot()
-            screenshot.save(filename)
-            return filename, "✓ Used full screen capture method"
+            return self._capture_screen(filename), "✓ Used full screen capture method"
             
         except Exception as e:
             return None, f"Error in Linux screenshot: {e}"
     
-    def send_to_discord(self, filename):
-        """Send screenshot to Discord webhook with custom message"""
+    def _get_mss(self):
+        """Return this thread's mss instance, creating it on first use"""
+        sct = getattr(self._thread_local, 'sct', None)
+        if sct is None:
+            sct = self._thread_local.sct = mss.mss()
+        return sct
+    
+    def _capture_screen(self, filename, region=None):
+        """Grab a (left, top, width, height) screen region, or the primary screen, as an image file"""
+        if not MSS_AVAILABLE:
+            return self._save_image(pyautogui.screenshot(region=region), filename)
+        
+        sct = self._get_mss()
+        if region:
+            left, top, width, height = region
+            monitor = {'left': left, 'top': top, 'width': width, 'height': height}
+        else:
+            monitor = sct.monitors[1]
+        raw = sct.grab(monitor)
+        return self._encode_bgrx(raw.bgra, raw.width, raw.height, filename)
+    
+    def _encode_bgrx(self, buffer, width, height, filename):
+        """Encode a packed BGRX pixel buffer in the configured format"""
+        if self._fast_jpeg:
+            # libjpeg-turbo reads the BGRX buffer as-is, no PIL unpack needed
+            bgrx = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+            return self._write_jpeg(bgrx, filename, 'BGRX')
+        return self._save_image(self._bgrx_to_image(buffer, width, height), filename)
+    
+    def _bgrx_to_image(self, buffer, width, height):
+        """Build an RGB PIL image from a packed BGRX pixel buffer"""
+        if NUMBA_AVAILABLE:
+            rgb = np.empty((height, width, 3), dtype=np.uint8)
+            _bgrx_to_rgb(np.frombuffer(buffer, dtype=np.uint8), rgb)
+            return Image.fromarray(rgb, 'RGB')
+        if NUMPY_AVAILABLE:
+            # One strided copy: drop X and reverse B,G,R -> R,G,B
+            bgrx = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+            return Image.fromarray(np.ascontiguousarray(bgrx[:, :, 2::-1]), 'RGB')
+        return Image.frombuffer('RGB', (width, height), buffer, 'raw', 'BGRX', 0, 1)
+    
+    @property
+    def _fast_jpeg(self):
+        """True when captures can be encoded straight from raw pixels with simplejpeg"""
+        return SIMPLEJPEG_AVAILABLE and self.image_format == 'jpeg'
+    
+    def _save_image(self, image, filename):
+        """Encode a captured image in the configured format, in memory or on disk
+        
+        Returns a BytesIO when delete_after_send is set, otherwise the filename.
+        """
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        if self._fast_jpeg:
+            return self._write_jpeg(np.asarray(image), filename, 'RGB')
+        
+        pil_format = self.IMAGE_FORMATS[self.image_format][1]
+        if pil_format == 'PNG':
+            # Discord recompresses previews anyway; fast zlib keeps capture cheap
+            options = {'compress_level': 1}
+        elif pil_format == 'WEBP':
+            options = {'quality': self.jpeg_quality, 'method': 4}
+        else:
+            options = {'quality': self.jpeg_quality, 'optimize': True, 'progressive': True}
+        
+        buf = self._memory_file(b'', filename)
+        image.save(buf, pil_format, **options)
+        if self.delete_after_send:
+            buf.seek(0)
+            return buf
+        return self._write_file(buf.getbuffer(), filename)
+    
+    def _write_jpeg(self, pixels, filename, colorspace):
+        """Encode a raw pixel array as JPEG with simplejpeg, in memory or on disk"""
+        data = simplejpeg.encode_jpeg(pixels, quality=self.jpeg_quality,
+                                      colorspace=colorspace, fastdct=True)
+        if self.delete_after_send:
+            return self._memory_file(data, filename)
+        return self._write_file(data, filename)
+    
+    @staticmethod
+    def _write_file(data, filename):
+        """Write an encoded image in one call, renamed into place once complete
+        
+        Folder watchers and a crash mid-write never see a half-written screenshot.
+        """
+        tmp_file = filename + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, filename)
+        return filename
+    
+    def _memory_file(self, data, filename):
+        """Wrap encoded image bytes in a BytesIO named like the file it replaces"""
+        buf = io.BytesIO(data)
+        buf.name = os.path.basename(filename)
+        return buf
+    
+    def send_to_discord(self, payloads):
+        """Send screenshots to Discord webhook with custom message
+        
+        payloads is one screenshot or a list of up to MAX_ATTACHMENTS, each either
+        a path to a saved screenshot or an in-memory BytesIO. A list is sent as a
+        single multi-file POST.
+        """
+        if not isinstance(payloads, list):
+            payloads = [payloads]
         try:
-            with open(filename, 'rb') as file:
-                files = {'file': (filename, file, 'image/png')}
-                
-                
-                content = self.format_message() if self.custom_message.strip() else None
-                
-                data = {}
-                if content:
-                    data['content'] = content
-                
-                response = requests.post(self.webhook_url, data=data, files=files)
-                
-                if response.status_code == 200:
-                    return True, "✓ Screenshot sent successfully"
-                else:
-                    return False, f"✗ Failed to send screenshot. Status code: {response.status_code}"
-                    
+            with contextlib.ExitStack() as stack:
+                files = {}
+                for i, payload in enumerate(payloads):
+                    if isinstance(payload, io.BytesIO):
+                        name, file = payload.name, payload
+                    else:
+                        name, file = os.path.basename(payload), stack.enter_context(open(payload, 'rb'))
+                    field = 'file' if len(payloads) == 1 else f'file{i}'
+                    files[field] = (name, file, self._mime_type(name))
+                return self._post_screenshots(files)
         except Exception as e:
             return False, f"✗ Error sending to Discord: {e}"
     
+    @staticmethod
+    def _create_session():
+        """Keep-alive session so webhook uploads reuse the TCP/TLS connection
+        
+        Only failed connects are retried here: the POST isn't idempotent, so a read
+        error or 5xx may already have posted the message. 429s are handled by
+        _post_screenshots, whose wait can be interrupted by Stop.
+        """
+        retry = Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5,
+                      allowed_methods=frozenset(['POST']), raise_on_status=False)
+        session = requests.Session()
+        session.headers.update({'Connection': 'keep-alive'})
+        session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                                                max_retries=retry))
+        return session
+    
+    def _ratelimit_reset(self, headers):
+        """Return when Discord's rate-limit bucket refills if this request emptied it, else None"""
+        if headers.get('X-RateLimit-Remaining') == '0':
+            try:
+                reset_after = float(headers.get('X-RateLimit-Reset-After', 0))
+            except ValueError:
+                return
+            return time.monotonic() + reset_after
+        return None
+    
+    def _next_webhook(self):
+        """Pick the next webhook round-robin, skipping ones whose rate-limit bucket is empty
+        
+        Returns (url, seconds to wait before posting to it).
+        """
+        now = time.monotonic()
+        best_url, best_wait = None, 0.0
+        for _ in range(len(self.webhook_urls)):
+            url = next(self._url_cycle)
+            wait = self._ratelimit_until.get(url, 0.0) - now
+            if wait <= 0:
+                return url, 0.0
+            if best_url is None or wait < best_wait:
+                best_url, best_wait = url, wait
+        return best_url, best_wait
+    
+    def _mime_type(self, name):
+        """MIME type for a screenshot file name, based on its extension"""
+        ext = os.path.splitext(name)[1].lower()
+        for format_ext, _, mime in self.IMAGE_FORMATS.values():
+            if ext == format_ext:
+                return mime
+        return 'application/octet-stream'
+    
+    def _post_screenshots(self, files):
+        """POST prepared multipart screenshot files to the webhook"""
+        content = self.format_message() if self.custom_message.strip() else None
+        
+        data = {}
+        if content:
+            data['content'] = content
+        
+        for _ in range(self.RATELIMIT_RETRIES + 1):
+            # Wait out an exhausted bucket instead of spending a request on a 429
+            url, delay = self._next_webhook()
+            if delay > 0:
+                # Monitoring threads wait on their run's stop event so Stop isn't held up;
+                # a manual screenshot runs on the UI thread, so it fails fast instead
+                stop_event = getattr(self._thread_local, 'stop_event', None)
+                if stop_event is None:
+                    return False, f"✗ Rate limited, retry in {int(delay) + 1}s"
+                if stop_event.wait(delay):
+                    return False, "✗ Upload cancelled: monitoring stopped during rate-limit wait"
+            
+            for _, file, _ in files.values():
+                file.seek(0)
+            response = self._session.post(url, data=data, files=files, timeout=(5, 30))
+            reset = self._ratelimit_reset(response.headers)
+            if response.status_code == 429:
+                # Hold this webhook off for Retry-After; the next pass waits it out
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 1.0))
+                except ValueError:
+                    retry_after = 1.0
+                reset = max(reset or 0.0, time.monotonic() + retry_after)
+            if reset is not None:
+                self._ratelimit_until[url] = reset
+            if response.status_code != 429:
+                break
+        
+        # 200 when Discord echoes the message back (?wait=true), 204 otherwise
+        if response.status_code in (200, 204):
+            noun = "Screenshot" if len(files) == 1 else f"{len(files)} screenshots"
+            return True, f"✓ {noun} sent successfully"
+        else:
+            return False, f"✗ Failed to send screenshot. Status code: {response.status_code}"
+    
     def cleanup_screenshot(self, filename):
         """Delete screenshot file if delete_after_send is True"""
         if self.delete_after_send:
             try:
-                os.remove(filename)
-                return True, f"✓ Deleted screenshot: {filename}"
+                self._io_pool.submit(self._remove_file, filename)
+                return True, f"✓ Deleting screenshot: {filename}"
             except Exception as e:
                 return False, f"✗ Error deleting file {filename}: {e}"
         return True, "Screenshot kept"
     
-    def take_single_screenshot(self):
-        """Take and send one screenshot"""
+    @staticmethod
+    def _remove_file(filename):
+        """Background half of cleanup_screenshot"""
+        try:
+            os.remove(filename)
+        except Exception as e:
+            print(f"✗ Error deleting file {filename}: {e}")
+    
+    def _frame_hash(self, payload):
+        """Compute a 64-bit difference hash (dHash) of a screenshot"""
+        try:
+            with Image.open(payload) as img:
+                # For JPEGs, let libjpeg decode at 1/8 scale instead of every pixel
+                img.draft('L', (64, 64))
+                small = img.convert('L').resize((9, 8), Image.BILINEAR)
+        finally:
+            if isinstance(payload, io.BytesIO):
+                payload.seek(0)
+        
+        pixels = list(small.getdata())
+        bits = 0
+        for row in range(0, 72, 9):
+            for col in range(row, row + 8):
+                bits = (bits << 1) | (pixels[col + 1] > pixels[col])
+        return bits
+    
+    def _is_unchanged(self, frame_hash):
+        """Check a frame hash against the last screenshot sent
+        
+        While a batch is filling, its newest frame counts as sent, so repeats
+        aren't queued twice. _last_hash only moves after a successful upload.
+        """
+        reference = self._pending_hash if self._pending else self._last_hash
+        if frame_hash is None or reference is None:
+            return False
+        return bin(frame_hash ^ reference).count('1') < self.UNCHANGED_HASH_DISTANCE
+    
+    def _capture(self, skip_unchanged=False):
+        """Capture one screenshot for upload
+        
+        Returns (payload, frame_hash, ok, message); payload is None when the capture
+        failed (ok False) or was skipped as unchanged (ok True). frame_hash is only
+        computed with skip_unchanged and is handed to _upload with the payload.
+        """
+        payload, message = self.take_screenshot()
+        
+        is_buffer = isinstance(payload, io.BytesIO)
+        if not is_buffer and not (payload and os.path.exists(payload)):
+            return None, None, False, f"Failed to take screenshot: {message}"
+        
+        frame_hash = None
+        if skip_unchanged:
+            try:
+                frame_hash = self._frame_hash(payload)
+            except Exception:
+                pass
+            if self._is_unchanged(frame_hash):
+                if not is_buffer:
+                    self.cleanup_screenshot(payload)
+                return None, None, True, f"{message}\nNo change since last screenshot, upload skipped"
+        return payload, frame_hash, True, message
+    
+    def _upload(self, payloads, frame_hash=None):
+        """Send captured screenshots and clean up the ones saved on disk
+        
+        frame_hash (of the newest payload) becomes the skip_unchanged reference once sent.
+        """
+        success, send_message = self.send_to_discord(payloads)
+        if success and frame_hash is not None:
+            self._last_hash = frame_hash
+        lines = [send_message]
+        on_disk = [p for p in payloads if not isinstance(p, io.BytesIO)]
+        in_memory = len(payloads) - len(on_disk)
+        
+        if success:
+            for payload in on_disk:
+                cleanup_success, cleanup_message = self.cleanup_screenshot(payload)
+                lines.append(cleanup_message)
+            if in_memory:
+                lines.append("Screenshot was never written to disk")
+        else:
+            if on_disk:
+                lines.append("Screenshot kept due to send failure")
+            if in_memory:
+                lines.append("In-memory screenshot discarded")
+        return success, "\n".join(lines)
+    
+    def take_single_screenshot(self, skip_unchanged=False):
+        """Take and send one screenshot
+        
+        With skip_unchanged, the upload is skipped if the window looks the same as last time.
+        """
         if not self.webhook_url or not self.app_name:
             return False, "Please configure webhook URL and application name first!"
             
-        filename, message = self.take_screenshot()
+        payload, frame_hash, ok, message = self._capture(skip_unchanged)
+        if payload is None:
+            return ok, message
         
-        if filename and os.path.exists(filename):
-            success, send_message = self.send_to_discord(filename)
-            if success:
-                cleanup_success, cleanup_message = self.cleanup_screenshot(filename)
-                return True, f"{message}\n{send_message}\n{cleanup_message}"
-            else:
-                return False, f"{message}\n{send_message}\nScreenshot kept due to send failure"
-        else:
-            return False, f"Failed to take screenshot: {message}"
+        success, upload_message = self._upload([payload], frame_hash)
+        return success, f"{message}\n{upload_message}"
+    
+    def _queue_screenshot(self, uploader=None):
+        """Capture one screenshot into the pending batch, flushing it to uploader when full or overdue"""
+        payload, frame_hash, ok, message = self._capture(self.skip_unchanged)
+        if payload is not None:
+            if not self._pending:
+                self._pending_deadline = time.monotonic() + self.BATCH_MAX_DELAY
+            self._pending.append(payload)
+            self._pending_hash = frame_hash
+        
+        batch_size = max(1, min(self.batch_size, self.MAX_ATTACHMENTS))
+        if self._pending and (len(self._pending) >= batch_size or
+                              time.monotonic() >= self._pending_deadline):
+            self._flush_pending(uploader)
+        return ok, message
+    
+    def _flush_pending(self, uploader=None):
+        """Upload every pending screenshot in one webhook POST
+        
+        With an uploader the batch is handed off instead of sent from this thread.
+        """
+        if not self._pending:
+            return True, "No pending screenshots"
+        batch, self._pending = self._pending, []
+        if uploader is not None:
+            self._upload_in_background(batch, uploader, self._pending_hash)
+            return True, "Upload started"
+        return self._upload(batch, self._pending_hash)
+    
+    def _upload_in_background(self, payloads, uploader, frame_hash=None):
+        """Hand screenshots to a run's uploader thread so the next capture overlaps the POST
+        
+        Blocks once UPLOAD_BACKLOG uploads are waiting (e.g. rate-limited), so a
+        stalled webhook can't pile up screenshots in memory.
+        """
+        upload_q, upload_slots, _ = uploader
+        upload_slots.acquire()
+        upload_q.put((payloads, frame_hash))
+    
+    def _start_uploader(self, stop_event):
+        """Start an uploader thread for the monitoring run that stop_event belongs to
+        
+        Returns (upload_q, upload_slots, thread); each run gets its own, so an
+        uploader still finishing a previous run can't touch the next run's queue.
+        """
+        upload_q = queue.SimpleQueue()
+        upload_slots = threading.BoundedSemaphore(self.UPLOAD_BACKLOG)
+        thread = threading.Thread(target=self._upload_loop, args=(stop_event, upload_q, upload_slots),
+                                  daemon=True)
+        thread.start()
+        return upload_q, upload_slots, thread
+    
+    def _upload_loop(self, stop_event, upload_q, upload_slots):
+        """Uploader thread: send queued screenshots until the None sentinel arrives"""
+        self._thread_local.stop_event = stop_event
+        while True:
+            item = upload_q.get()
+            if item is None:
+                return
+            try:
+                self._report_status(*self._upload(*item))
+            except Exception as e:
+                self._report_status(False, f"✗ Error uploading screenshots: {e}")
+            finally:
+                upload_slots.release()
+    
+    def _wait_for_upload(self, uploader):
+        """Let a run's uploader finish everything queued, then stop it"""
+        upload_q, _, thread = uploader
+        upload_q.put(None)
+        thread.join()
+    
+    def _report_status(self, success, message):
+        """Pass a monitoring result to on_status, or print it when nothing is listening"""
+        callback = self.on_status
+        if callback is not None:
+            callback(success, message)
+        elif not success:
+            print(message)
     
     def start_monitoring(self):
         """Start continuous monitoring in a separate thread"""
@@ -589,23 +1291,44 @@ class ApplicationScreenshotter:
             
         if self.running:
             return False, "Monitoring is already running!"
+        
+        # stop_monitoring only waits 2 s; the last run may still be flushing uploads
+        if self.monitor_busy:
+            return False, "Previous monitoring run is still finishing uploads, try again shortly"
             
         self.running = True
-        self.monitor_thread = threading.Thread(target=self._monitoring_loop)
+        self._last_hash = None
+        # A fresh Event per run: clearing a shared one could revive a loop that outlived its stop
+        stop_event = self._stop_event = threading.Event()
+        self.monitor_thread = threading.Thread(target=self._monitoring_loop,
+                                               args=(stop_event, self._start_uploader(stop_event)))
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
         return True, f"Started monitoring '{self.app_name}' every {self.interval} seconds"
     
-    def _monitoring_loop(self):
-        """Main monitoring loop"""
-        while self.running:
-            self.take_single_screenshot()
-            
-            
-            for _ in range(self.interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+    @property
+    def monitor_busy(self):
+        """True while a monitoring run's thread is alive, including after Stop while it flushes uploads"""
+        return self.monitor_thread is not None and self.monitor_thread.is_alive()
+    
+    def _monitoring_loop(self, stop_event, uploader):
+        """Main monitoring loop; stop_event and uploader belong to this run only"""
+        self._thread_local.stop_event = stop_event
+        while not stop_event.is_set():
+            if self.batch_size > 1:
+                ok, message = self._queue_screenshot(uploader)
+            else:
+                payload, frame_hash, ok, message = self._capture(self.skip_unchanged)
+                if payload is not None:
+                    self._upload_in_background([payload], uploader, frame_hash)
+            if not ok:
+                self._report_status(ok, message)
+            stop_event.wait(timeout=self.interval)
+        
+        # Don't strand a partial batch when monitoring stops
+        self._wait_for_upload(uploader)
+        if self._pending:
+            self._report_status(*self._flush_pending())
     
     def stop_monitoring(self):
         """Stop continuous monitoring"""
@@ -613,944 +1336,246 @@ class ApplicationScreenshotter:
             return False, "Monitoring is not running!"
             
         self.running = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
+        _snapshot_processes.cache_clear()
+        if sys.platform == "win32":
+            with self._gdi_lock:
+                self._release_gdi()
         return True, "Stopped monitoring"
 
 
-class ScreenshotBotGUI:
-    def __init__(self):
-        self.bot = ApplicationScreenshotter()
-        self.config_found = self.bot.load_config()
-        self.root = tk.Tk()
-        self.root.title("Screenshot Discord Bot")
-        self.root.geometry("1300x900")
-        self.root.resizable(True, True)
-        self.root.configure(bg='#1e1e1e')
-        
-        
-        self.fade_alpha = 0.0
-        self.pulse_scale = 1.0
-        self.pulse_direction = 1
-        self.status_colors = {
-            'success': '#4ade80',
-            'error': '#ef4444',
-            'warning': '#f59e0b',
-            'info': '#3b82f6'
-        }
-        
-        
-        self.setup_styles()
-        
-        
-        self.create_animated_header()
-        
-        self.create_widgets()
-        self.update_status()
-        
-        
-        self.root.after(50, self.animate_pulse)
-        self.root.after(100, self.update_status_loop)
-        self.animate_fade_in()
-        
-        
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-    
-    def on_closing(self):
-        """Handle window closing - save config and stop monitoring"""
-        if self.bot.running:
-            self.bot.stop_monitoring()
-        self.root.destroy()
-    
-    def setup_styles(self):
-        """Setup dark theme styles with modern look"""
-        style = ttk.Style()
-        
-        
-        style.theme_use('clam')
-        
-        
-        bg_color = '#1e1e1e'
-        card_color = '#2d2d2d'
-        accent_color = '#3b82f6'
-        text_color = '#ffffff'
-        secondary_text = '#a1a1aa'
-        
-        
-        style.configure('Title.TLabel', 
-                       background=bg_color, 
-                       foreground=text_color,
-                       font=('Segoe UI', 24, 'bold'))
-        
-        style.configure('Card.TFrame', 
-                       background=card_color,
-                       relief='flat',
-                       borderwidth=1)
-        
-        style.configure('Modern.TLabel',
-                       background=card_color,
-                       foreground=text_color,
-                       font=('Segoe UI', 10))
-        
-        style.configure('Secondary.TLabel',
-                       background=card_color,
-                       foreground=secondary_text,
-                       font=('Segoe UI', 9))
-        
-        style.configure('Modern.TEntry',
-                       borderwidth=1,
-                       relief='flat',
-                       font=('Segoe UI', 10),
-                       fieldbackground='#374151',
-                       foreground=text_color,
-                       bordercolor=accent_color,
-                       lightcolor=accent_color,
-                       darkcolor=accent_color)
-        
-        style.configure('Action.TButton',
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Action.TButton',
-                 background=[('active', '#2563eb'), ('!active', accent_color)],
-                 foreground=[('active', 'white'), ('!active', 'white')])
-        
-        style.configure('Success.TButton',
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Success.TButton',
-                 background=[('active', '#16a34a'), ('!active', '#22c55e')],
-                 foreground=[('active', 'white'), ('!active', 'white')])
-        
-        style.configure('Danger.TButton',
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Danger.TButton',
-                 background=[('active', '#dc2626'), ('!active', '#ef4444')],
-                 foreground=[('active', 'white'), ('!active', 'white')])
-    
-    def create_animated_header(self):
-        """Create animated header with gradient effect"""
-        self.header_frame = tk.Frame(self.root, bg='#1e1e1e', height=100)
-        self.header_frame.pack(fill=tk.X, pady=(0, 20))
-        self.header_frame.pack_propagate(False)
-        
-        
-        self.title_label = tk.Label(
-            self.header_frame,
-            text="Screenshot Discord Bot",
-            font=('Segoe UI', 28, 'bold'),
-            fg='#3b82f6',
-            bg='#1e1e1e'
-        )
-        self.title_label.pack(expand=True)
-        
-        
-        self.subtitle_label = tk.Label(
-            self.header_frame,
-            text="",
-            font=('Segoe UI', 12),
-            fg='#a1a1aa',
-            bg='#1e1e1e'
-        )
-        self.subtitle_label.pack()
-        
-        
-        self.typewriter_text = "Automated screenshot capture and Discord integration"
-        self.typewriter_index = 0
-        self.root.after(2000, self.animate_typewriter)
-    
-    def animate_typewriter(self):
-        """Animate typewriter effect for subtitle"""
-        if self.typewriter_index <= len(self.typewriter_text):
-            self.subtitle_label.config(text=self.typewriter_text[:self.typewriter_index])
-            self.typewriter_index += 1
-            self.root.after(50, self.animate_typewriter)
-    
-    def animate_fade_in(self):
-        """Animate window fade in effect"""
-        if self.fade_alpha < 1.0:
-            self.fade_alpha += 0.05
-            
-            self.root.after(30, self.animate_fade_in)
-    
-    def animate_pulse(self):
-        """Animate pulsing effect for monitoring status"""
-        if hasattr(self, 'status_indicator') and self.bot.running:
-            self.pulse_scale += 0.02 * self.pulse_direction
-            if self.pulse_scale >= 1.1:
-                self.pulse_direction = -1
-            elif self.pulse_scale <= 0.9:
-                self.pulse_direction = 1
-            
-            
-            pulse_size = int(12 * self.pulse_scale)
-            self.status_indicator.config(font=('Segoe UI', pulse_size, 'bold'))
-        
-        self.root.after(50, self.animate_pulse)
-    
-    def create_widgets(self):
-        """Create all GUI widgets including scrollable content area."""
-        
-        self.canvas = tk.Canvas(self.root, bg='#1e1e1e', highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas, bg='#1e1e1e')
-        
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(30, 0), pady=(20, 20))
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 30), pady=(20, 20))
-        
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        
-        self.scrollable_frame.bind("<Configure>", 
-                                   lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
-        # Left and Right split
-        left_frame = tk.Frame(self.scrollable_frame, bg='#1e1e1e')
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15))
-
-        self.right_frame = tk.Frame(self.scrollable_frame, bg='#1e1e1e', width=350)
-        # Note: self.right_frame is not expanded vertically to prevent stretching
-        self.right_frame.pack(side=tk.RIGHT, fill=tk.Y)
+# Home the cursor and erase the display; replaces spawning cls/clear every redraw
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
 
-        # Left side cards
-        config_card = self.create_card(left_frame, "Configuration")
-        config_card.pack(fill=tk.X, pady=(0, 20))
-        
-        # Webhook URL
-        webhook_frame = tk.Frame(config_card, bg='#2d2d2d')
-        webhook_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
-        webhook_label = tk.Label(webhook_frame, text="Discord Webhook URL", 
-                                font=('Segoe UI', 10, 'bold'), fg='#ffffff', bg='#2d2d2d')
-        webhook_label.pack(anchor=tk.W)
-        webhook_desc = tk.Label(webhook_frame, text="Enter your Discord webhook URL to send screenshots",
-                                font=('Segoe UI', 8), fg='#a1a1aa', bg='#2d2d2d')
-        webhook_desc.pack(anchor=tk.W)
-        self.webhook_var = tk.StringVar(value=self.bot.webhook_url)
-        webhook_entry = ttk.Entry(webhook_frame, textvariable=self.webhook_var, style='Modern.TEntry')
-        webhook_entry.pack(fill=tk.X, ipady=5, pady=(5, 0))
-
-        # Application Name
-        app_frame = tk.Frame(config_card, bg='#2d2d2d')
-        app_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
-        app_label = tk.Label(app_frame, text="Application Name", 
-                            font=('Segoe UI', 10, 'bold'), fg='#ffffff', bg='#2d2d2d')
-        app_label.pack(anchor=tk.W)
-        app_desc = tk.Label(app_frame, text="Choose which application to screenshot",
-                            font=('Segoe UI', 8), fg='#a1a1aa', bg='#2d2d2d')
-        app_desc.pack(anchor=tk.W)
-        self.app_var = tk.StringVar(value=self.bot.app_name)
-        
-        app_entry_frame = tk.Frame(app_frame, bg='#2d2d2d')
-        app_entry_frame.pack(fill=tk.X, pady=(5,0))
-        
-        app_entry = ttk.Entry(app_entry_frame, textvariable=self.app_var, style='Modern.TEntry')
-        app_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
-        app_btn = tk.Button(app_entry_frame, text="Browse", font=('Segoe UI', 9, 'bold'),
-                            bg='#6b7280', fg='white', bd=0, padx=10, pady=5,
-                            cursor='hand2', command=self.show_applications)
-        app_btn.pack(side=tk.LEFT, padx=(5, 0))
+BANNER = (
+    "=" * 60 + "\n"
+    "      APPLICATION SCREENSHOT DISCORD BOT\n"
+    + "=" * 60 + "\n"
+)
 
+MENU = """
+--- Menu ---
+1. Set Discord Webhook URL
+2. Set Application Name
+3. List Running Applications
+4. Set Custom Message
+5. Set Screenshot Interval
+6. Toggle Delete After Send
+7. Take Single Screenshot
+8. Start Continuous Monitoring
+9. Stop Monitoring
+10. Save Configuration
+11. Exit
+"""
 
-        # Custom Message
-        message_frame = tk.Frame(config_card, bg='#2d2d2d')
-        message_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
-        
-        message_label = tk.Label(message_frame, text="Custom Message", 
-                                font=('Segoe UI', 10, 'bold'), fg='#ffffff', bg='#2d2d2d')
-        message_label.pack(anchor=tk.W)
-        
-        message_desc = tk.Label(message_frame, text="customize the message sent with screenshots. Leave empty for only image",
-                                font=('Segoe UI', 8), fg='#a1a1aa', bg='#2d2d2d')
-        message_desc.pack(anchor=tk.W)
-        
-        # Frame to hold entry and help button together
-        entry_help_frame = tk.Frame(message_frame, bg='#2d2d2d')
-        entry_help_frame.pack(fill=tk.X, pady=(5, 0))
-        
-        self.message_var = tk.StringVar(value=self.bot.custom_message)
-        message_entry = ttk.Entry(entry_help_frame, textvariable=self.message_var, style='Modern.TEntry')
-        message_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
-        
-        message_help_btn = tk.Button(entry_help_frame, text="?", font=('Segoe UI', 8, 'bold'),
-                                     bg='#374151', fg='#ffffff', bd=0, width=2,
-                                     cursor='hand2', command=self.show_message_help)
-        message_help_btn.pack(side=tk.LEFT, padx=(5, 0))
-
-        self.message_preview = tk.Label(message_frame, text="", 
-                                       font=('Segoe UI', 8, 'italic'), fg='#4ade80', bg='#2d2d2d')
-        self.message_preview.pack(anchor=tk.W, pady=(5, 0))
-        self.message_var.trace('w', self.update_message_preview)
-        self.update_message_preview()
-        
-        # Interval & Delete after send
-        options_frame = tk.Frame(config_card, bg='#2d2d2d')
-        options_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
-        
-        interval_frame = tk.Frame(options_frame, bg='#2d2d2d')
-        interval_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        interval_label = tk.Label(interval_frame, text="Interval (seconds):", 
-                                font=('Segoe UI', 10), fg='#ffffff', bg='#2d2d2d')
-        interval_label.pack(anchor=tk.W)
-        self.interval_var = tk.StringVar(value=str(self.bot.interval))
-        interval_entry = ttk.Entry(interval_frame, textvariable=self.interval_var, style='Modern.TEntry')
-        interval_entry.pack(fill=tk.X, ipady=5, pady=(5, 0))
-        
-        # New Toggle Switch for Delete After Send
-        toggle_frame = tk.Frame(options_frame, bg='#2d2d2d')
-        toggle_frame.pack(side=tk.RIGHT, padx=(10, 0), pady=(15, 0))
-        toggle_label = tk.Label(toggle_frame, text="Delete after send:",
-                                font=('Segoe UI', 10), fg='#ffffff', bg='#2d2d2d')
-        toggle_label.pack(side=tk.LEFT, padx=(0, 5))
-        self.delete_var = tk.BooleanVar(value=self.bot.delete_after_send)
-        self.delete_toggle = ToggleSwitch(
-            toggle_frame, 
-            bg='#2d2d2d', 
-            on_command=lambda: self.delete_var.set(True), 
-            off_command=lambda: self.delete_var.set(False)
-        )
-        self.delete_toggle.pack(side=tk.LEFT)
-        if self.bot.delete_after_send:
-            self.delete_toggle.state = True
-            self.delete_toggle.draw_toggle()
-            
-        # Save Configuration Button
-        save_frame = tk.Frame(config_card, bg='#2d2d2d')
-        save_frame.pack(fill=tk.X, padx=20, pady=(10, 20))
-        
-        self.save_btn = tk.Button(save_frame, text="Save Configuration",
-                                  font=('Segoe UI', 11, 'bold'), bg='#6366f1', fg='white',
-                                  bd=0, padx=20, pady=10, cursor='hand2',
-                                  command=self.save_config_animated)
-        self.save_btn.pack(expand=True)
 
+def enable_ansi():
+    """Turn on VT escape sequence handling in the Windows console (no-op elsewhere)"""
+    if os.name == 'nt':
+        # An empty system() call makes cmd enable virtual terminal processing
+        os.system('')
 
-        # Actions Card
-        action_card = self.create_card(left_frame, "Actions")
-        action_card.pack(fill=tk.X, pady=(0, 20))
-        
-        btn_frame = tk.Frame(action_card, bg='#2d2d2d', padx=20, pady=20)
-        btn_frame.pack(fill=tk.X)
-        
-        self.screenshot_btn = tk.Button(btn_frame, text="Take Screenshot",
-                                        font=('Segoe UI', 11, 'bold'), bg='#3b82f6', fg='white',
-                                        bd=0, padx=20, pady=10, cursor='hand2',
-                                        command=self.take_screenshot_animated)
-        self.screenshot_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        self.start_btn = tk.Button(btn_frame, text="Start Monitoring",
-                                    font=('Segoe UI', 11, 'bold'), bg='#22c55e', fg='white',
-                                    bd=0, padx=20, pady=10, cursor='hand2',
-                                    command=self.start_monitoring_animated)
-        self.start_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 5))
-        
-        self.stop_btn = tk.Button(btn_frame, text="Stop Monitoring",
-                                   font=('Segoe UI', 11, 'bold'), bg='#ef4444', fg='white',
-                                   bd=0, padx=20, pady=10, cursor='hand2', state='disabled',
-                                   command=self.stop_monitoring_animated)
-        self.stop_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
-
-        # Show Console Toggle
-        console_toggle_frame = tk.Frame(action_card, bg='#2d2d2d')
-        console_toggle_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
-        console_label = tk.Label(console_toggle_frame, text="Show Status Log:",
-                                font=('Segoe UI', 10), fg='#ffffff', bg='#2d2d2d')
-        console_label.pack(side=tk.LEFT, padx=(0, 5))
-        self.show_console_var = tk.BooleanVar(value=True)
-        self.show_console_toggle = ToggleSwitch(
-            console_toggle_frame,
-            bg='#2d2d2d',
-            on_command=self.show_console,
-            off_command=self.hide_console
-        )
-        self.show_console_toggle.pack(side=tk.LEFT)
-        self.show_console_toggle.state = True
-        self.show_console_toggle.draw_toggle()
-
-        # Right side: Status & Activity
-        self.status_card = self.create_card(self.right_frame, "Status & Activity")
-        self.status_card.pack(fill=tk.BOTH, expand=True)
-
-        status_header = tk.Frame(self.status_card, bg='#2d2d2d')
-        status_header.pack(fill=tk.X, padx=20, pady=(10, 0))
-
-        self.status_indicator = tk.Label(status_header, text="●", font=('Segoe UI', 12, 'bold'),
-                                        fg='#ef4444', bg='#2d2d2d')
-        self.status_indicator.pack(side=tk.LEFT)
-
-        self.status_text_label = tk.Label(status_header, text="Stopped", font=('Segoe UI', 11, 'bold'),
-                                         fg='#ffffff', bg='#2d2d2d')
-        self.status_text_label.pack(side=tk.LEFT, padx=(5, 0))
-
-        log_frame = tk.Frame(self.status_card, bg='#2d2d2d')
-        log_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 20))
-
-        self.status_text = tk.Text(log_frame, font=('Consolas', 9), bg='#1a1a1a',
-                                  fg='#e5e5e5', bd=0, padx=15, pady=10,
-                                  insertbackground='#3b82f6', selectbackground='#374151')
-
-        scrollbar = tk.Scrollbar(log_frame, bg='#374151', troughcolor='#2d2d2d',
-                                borderwidth=0, highlightthickness=0)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.status_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.status_text.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=self.status_text.yview)
-
-        self.status_text.tag_configure("success", foreground="#4ade80")
-        self.status_text.tag_configure("error", foreground="#ef4444")
-        self.status_text.tag_configure("warning", foreground="#f59e0b")
-        self.status_text.tag_configure("info", foreground="#3b82f6")
-        self.status_text.tag_configure("timestamp", foreground="#6b7280")
-    
-    def _on_mousewheel(self, event):
-        """Handles mousewheel scrolling for the canvas."""
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-    def show_console(self):
-        """Show the status and activity log frame and resize the window."""
-        self.right_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(15, 0))
-        current_height = self.root.winfo_height()
-        self.root.geometry(f"1100x{current_height}")
-    
-    def hide_console(self):
-        """Hide the status and activity log frame and resize the window."""
-        self.right_frame.pack_forget()
-        current_height = self.root.winfo_height()
-        self.root.geometry(f"700x{current_height}")
-    
-    def show_message_help(self):
-        """Show help dialog for message variables"""
-        help_window = tk.Toplevel(self.root)
-        help_window.title("Message Variables Help")
-        help_window.geometry("600x500")
-        help_window.configure(bg='#1e1e1e')
-        help_window.resizable(False, False)
-        help_window.transient(self.root)
-        help_window.grab_set()
-        
-        
-        header = tk.Frame(help_window, bg='#374151', height=60)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        title = tk.Label(header, text="Available Message Variables",
-                        font=('Segoe UI', 16, 'bold'), fg='#ffffff', bg='#374151')
-        title.pack(expand=True)
-        
-        
-        content_frame = tk.Frame(help_window, bg='#1e1e1e')
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        help_text = tk.Text(content_frame, font=('Consolas', 10), bg='#2d2d2d',
-                           fg='#ffffff', bd=0, padx=15, pady=15, wrap=tk.WORD)
-        help_text.pack(fill=tk.BOTH, expand=True)
-        
-        help_content = """Available Variables (use with curly braces):
 
-{app_name}     - Name of the target application
-{timestamp}    - Full date and time (YYYY-MM-DD HH:MM:SS)
-{date}         - Date only (YYYY-MM-DD)  
-{time}         - Time only (HH:MM:SS)
-{day}          - Day of the week (Monday, Tuesday, etc.)
-{month}        - Month name (January, February, etc.)
-{year}         - Year (YYYY)
+def format_current_config(bot):
+    """Return the current configuration block as a string"""
+    return (
+        f"\n--- Current Configuration ---\n"
+        f"Webhook URL: {'✓ Set' if bot.webhook_url else '✗ Not set'}\n"
+        f"Application: {bot.app_name if bot.app_name else '✗ Not set'}\n"
+        f"Custom Message: {bot.custom_message if bot.custom_message else '✗ No message'}\n"
+        f"Interval: {bot.interval} seconds\n"
+        f"Delete after send: {'Yes' if bot.delete_after_send else 'No'}\n"
+        f"Skip unchanged frames: {'Yes' if bot.skip_unchanged else 'No'}\n"
+        f"Screenshots per upload: {bot.batch_size}\n"
+        f"Image format: {bot.image_format}\n"
+        f"Status: {'🟢 Running' if bot.running else '🔴 Stopped'}\n"
+    )
 
-Examples:
 
-"Screenshot of {app_name} taken at {time}"
-→ "Screenshot of notepad taken at 14:30:25"
+_input_queue = queue.Queue()
+_input_thread = None
 
-"{app_name} capture on {day}"
-→ "notepad capture on Monday"
 
-"Daily {app_name} screenshot - {date}"
-→ "Daily notepad screenshot - 2024-01-15"
+def _read_stdin():
+    """Feed stdin lines into _input_queue; an empty string marks EOF"""
+    while True:
+        line = sys.stdin.readline()
+        _input_queue.put(line)
+        if not line:
+            return
 
-"Custom message without variables"
-→ "Custom message without variables"
 
-Leave empty for no message (image only).
-"""
-        
-        help_text.insert(tk.END, help_content)
-        help_text.config(state=tk.DISABLED)
-        
-        
-        close_btn = tk.Button(content_frame, text="Close", font=('Segoe UI', 11, 'bold'),
-                             bg='#3b82f6', fg='white', bd=0, padx=30, pady=10,
-                             cursor='hand2', command=help_window.destroy)
-        close_btn.pack(pady=(10, 0))
-    
-    def update_message_preview(self, *args):
-        """Update the message preview"""
-        try:
-            
-            old_message = self.bot.custom_message
-            self.bot.custom_message = self.message_var.get()
-            preview = self.bot.format_message()
-            self.bot.custom_message = old_message
-            
-            if preview and len(preview) > 80:
-                preview = preview[:77] + "..."
-            
-            self.message_preview.config(text=f"Preview: {preview}" if preview else "Preview: (no message)")
-        except Exception:
-            self.message_preview.config(text="Preview: (invalid format)")
-    
-    def save_config_animated(self):
-        """Save configuration with button animation"""
-        self.animate_button_click(self.save_btn)
-        self.update_config()
-        self.bot.save_config()
-        self.log_message_colored("Configuration saved successfully!", 'success')
-        self.show_notification("Success", "Configuration saved!", 'success')
-    
-    def create_card(self, parent, title):
-        """Create a modern card with title"""
-        card_frame = tk.Frame(parent, bg='#2d2d2d', relief='flat', bd=1)
-        
-        
-        header = tk.Frame(card_frame, bg='#374151', height=50)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        title_label = tk.Label(header, text=title, font=('Segoe UI', 14, 'bold'),
-                              fg='#ffffff', bg='#374151')
-        title_label.pack(expand=True)
-        
-        return card_frame
+def async_input(prompt=""):
+    """input() replacement that reads stdin on a background thread
     
-    def animate_entry_focus(self, widget, focused):
-        """Animate entry field focus"""
-        if focused:
-            widget.config(highlightcolor='#3b82f6', highlightbackground='#3b82f6', highlightthickness=2)
-        else:
-            widget.config(highlightthickness=1)
-    
-    def animate_button_hover(self, widget, hovering):
-        """Animate button hover effect"""
-        if hovering:
-            current_bg = widget.cget('bg')
-            if current_bg == '#3b82f6':
-                widget.config(bg='#2563eb')
-            elif current_bg == '#22c55e':
-                widget.config(bg='#16a34a')
-            elif current_bg == '#ef4444':
-                widget.config(bg='#dc2626')
-            elif current_bg == '#6366f1':
-                widget.config(bg='#4f46e5')
-            elif current_bg == '#6b7280':
-                widget.config(bg='#4b5563')
-        else:
-            current_bg = widget.cget('bg')
-            if current_bg == '#2563eb':
-                widget.config(bg='#3b82f6')
-            elif current_bg == '#16a34a':
-                widget.config(bg='#22c55e')
-            elif current_bg == '#dc2626':
-                widget.config(bg='#ef4444')
-            elif current_bg == '#4f46e5':
-                widget.config(bg='#6366f1')
-            elif current_bg == '#4b5563':
-                widget.config(bg='#6b7280')
-    
-    def show_applications(self):
-        """Show running applications in a modern popup"""
-        apps = self.bot.list_running_applications()
-        
-        app_window = tk.Toplevel(self.root)
-        app_window.title("Select Application")
-        app_window.geometry("500x600")
-        app_window.configure(bg='#1e1e1e')
-        app_window.resizable(False, False)
-        
-        
-        app_window.transient(self.root)
-        app_window.grab_set()
-        
-        
-        header = tk.Frame(app_window, bg='#374151', height=60)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        title = tk.Label(header, text="Select Target Application",
-                        font=('Segoe UI', 16, 'bold'), fg='#ffffff', bg='#374151')
-        title.pack(expand=True)
-        
-        
-        search_frame = tk.Frame(app_window, bg='#1e1e1e')
-        search_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        search_label = tk.Label(search_frame, text="Search:", font=('Segoe UI', 10),
-                               fg='#ffffff', bg='#1e1e1e')
-        search_label.pack(anchor=tk.W)
-        
-        search_var = tk.StringVar()
-        search_entry = tk.Entry(search_frame, textvariable=search_var,
-                               font=('Segoe UI', 10), bg='#374151', fg='#ffffff',
-                               bd=0, highlightthickness=1, highlightcolor='#3b82f6',
-                               insertbackground='#ffffff')
-        search_entry.pack(fill=tk.X, ipady=8, pady=(5, 0))
-        
-        
-        list_frame = tk.Frame(app_window, bg='#1e1e1e')
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
-        
-        
-        listbox_frame = tk.Frame(list_frame, bg='#2d2d2d')
-        listbox_frame.pack(fill=tk.BOTH, expand=True)
-        
-        scrollbar = tk.Scrollbar(listbox_frame, bg='#374151', troughcolor='#2d2d2d')
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        listbox = tk.Listbox(listbox_frame, yscrollcommand=scrollbar.set,
-                            font=('Segoe UI', 10), bg='#2d2d2d', fg='#ffffff',
-                            selectbackground='#3b82f6', selectforeground='#ffffff',
-                            bd=0, highlightthickness=0, activestyle='none')
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=listbox.yview)
-        
-        
-        all_apps = apps[:]
-        for app in all_apps:
-            listbox.insert(tk.END, app)
-        
-        def filter_apps():
-            """Filter applications based on search"""
-            query = search_var.get().lower()
-            listbox.delete(0, tk.END)
-            for app in all_apps:
-                if query in app.lower():
-                    listbox.insert(tk.END, app)
-        
-        search_var.trace('w', lambda *args: filter_apps())
-        
-        def select_app():
-            """Select application with animation"""
-            selection = listbox.curselection()
-            if selection:
-                selected_app = listbox.get(selection[0])
-                self.app_var.set(selected_app.lower())
-                
-                
-                for i in range(3):
-                    listbox.config(selectbackground='#22c55e')
-                    app_window.update()
-                    self.root.after(100)
-                    listbox.config(selectbackground='#3b82f6')
-                    app_window.update()
-                    self.root.after(100)
-                
-                app_window.destroy()
-        
-        
-        btn_frame = tk.Frame(app_window, bg='#1e1e1e')
-        btn_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
-        
-        select_btn = tk.Button(btn_frame, text="Select Application",
-                              font=('Segoe UI', 11, 'bold'), bg='#22c55e', fg='white',
-                              bd=0, padx=30, pady=10, cursor='hand2',
-                              command=select_app)
-        select_btn.pack()
-        
-        
-        listbox.bind('<Double-Button-1>', lambda e: select_app())
-    
-    def take_screenshot_animated(self):
-        """Take screenshot with button animation"""
-        self.animate_button_click(self.screenshot_btn)
-        self.update_config()
-        success, message = self.bot.take_single_screenshot()
-        self.log_message_colored(message, 'success' if success else 'error')
-        if not success:
-            self.show_notification("Error", message, 'error')
-    
-    def start_monitoring_animated(self):
-        """Start monitoring with button animation"""
-        self.animate_button_click(self.start_btn)
-        self.update_config()
-        success, message = self.bot.start_monitoring()
-        self.log_message_colored(message, 'success' if success else 'error')
-        if not success:
-            self.show_notification("Error", message, 'error')
-        else:
-            self.show_notification("Success", "Monitoring started!", 'success')
-    
-    def stop_monitoring_animated(self):
-        """Stop monitoring with button animation"""
-        self.animate_button_click(self.stop_btn)
-        success, message = self.bot.stop_monitoring()
-        self.log_message_colored(message, 'success' if success else 'warning')
-    
-    def animate_button_click(self, button):
-        """Animate button click effect"""
-        original_relief = button.cget('relief')
-        button.config(relief='sunken')
-        self.root.after(100, lambda: button.config(relief=original_relief))
-    
-    def show_notification(self, title, message, type_='info'):
-        """Show animated notification"""
-        notification = tk.Toplevel(self.root)
-        notification.title(title)
-        notification.geometry("400x120")
-        notification.configure(bg=self.status_colors.get(type_, '#3b82f6'))
-        notification.resizable(False, False)
-        
-        
-        notification.geometry("+{}+{}".format(
-            self.root.winfo_x() + self.root.winfo_width() - 420,
-            self.root.winfo_y() + 50
-        ))
-        
-        
-        notification.overrideredirect(True)
-        
-        
-        content_frame = tk.Frame(notification, bg=self.status_colors.get(type_, '#3b82f6'))
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-        
-        title_label = tk.Label(content_frame, text=title, font=('Segoe UI', 12, 'bold'),
-                              fg='white', bg=self.status_colors.get(type_, '#3b82f6'))
-        title_label.pack(anchor=tk.W)
-        
-        msg_label = tk.Label(content_frame, text=message, font=('Segoe UI', 10),
-                            fg='white', bg=self.status_colors.get(type_, '#3b82f6'),
-                            wraplength=350)
-        msg_label.pack(anchor=tk.W, pady=(5, 0))
-        
-        
-        self.root.after(3000, notification.destroy)
+    The main thread waits on a queue with a short timeout instead of blocking in
+    the read, so Ctrl-C is delivered immediately even on Windows.
+    """
+    global _input_thread
+    if _input_thread is None:
+        _input_thread = threading.Thread(target=_read_stdin, daemon=True)
+        _input_thread.start()
     
-    def update_config(self):
-        """Update bot configuration from GUI"""
-        self.bot.webhook_url = self.webhook_var.get().strip()
-        self.bot.app_name = self.app_var.get().strip().lower()
-        self.bot.custom_message = self.message_var.get().strip()
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    while True:
         try:
-            self.bot.interval = int(self.interval_var.get())
-        except ValueError:
-            self.bot.interval = 60
-            self.interval_var.set("60")
-        self.bot.delete_after_send = self.delete_var.get()
-    
-    def log_message_colored(self, message, type_='info'):
-        """Add colored message to status log with animation"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        
-        self.status_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-        
-        if type_ == 'success':
-            self.status_text.insert(tk.END, "✅ ", "success")
-        elif type_ == 'error':
-            self.status_text.insert(tk.END, "❌ ", "error")
-        elif type_ == 'warning':
-            self.status_text.insert(tk.END, "⚠ ", "warning")
-        else:
-            self.status_text.insert(tk.END, "ℹ ", "info")
-        
-        self.status_text.insert(tk.END, f"{message}\n")
-        self.status_text.see(tk.END)
-        
-        
-        self.animate_scroll_to_bottom()
-    
-    def animate_scroll_to_bottom(self):
-        """Smooth scroll animation to bottom"""
-        def scroll_step(step=0):
-            if step < 5:
-                self.status_text.see(tk.END)
-                self.root.after(20, lambda: scroll_step(step + 1))
-        scroll_step()
-    
-    def update_status(self):
-        """Update status display with animations"""
-        webhook_status = "✓" if self.bot.webhook_url else "✗"
-        app_status = "✓" if self.bot.app_name else "✗"
-        
-        if self.bot.running:
-            self.status_indicator.config(fg='#22c55e', text="●")
-            self.status_text_label.config(text="Monitoring Active", fg='#22c55e')
-            self.start_btn.config(state='disabled', text="Running...")
-            self.stop_btn.config(state='normal')
-        else:
-            self.status_indicator.config(fg='#ef4444', text="●")
-            self.status_text_label.config(text="Stopped", fg='#ef4444')
-            self.start_btn.config(state='normal', text="Start Monitoring")
-            self.stop_btn.config(state='disabled')
-        
-        
-        status = f"Webhook: {webhook_status} | App: {app_status} | Interval: {self.bot.interval}s"
-        self.root.title(f"Screenshot Discord Bot - {status}")
-    
-    def update_status_loop(self):
-        """Continuous status update with smooth transitions"""
-        self.update_status()
-        self.root.after(1000, self.update_status_loop)
-    
-    def run(self):
-        """Start the GUI with fade-in animation"""
-        
-        self.root.update_idletasks()
-        
-        
-        self.root.after(1000, lambda: self.log_message_colored("Welcome to Screenshot Discord Bot!", 'info'))
-        if self.config_found:
-            self.root.after(2000, lambda: self.log_message_colored("Config found, successfully loaded", 'success'))
+            line = _input_queue.get(timeout=0.25)
+            break
+        except queue.Empty:
+            continue
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def draw_menu(bot):
+    """Redraw the whole menu screen with a single buffered write"""
+    sys.stdout.write(CLEAR_SCREEN + BANNER + format_current_config(bot) + MENU)
+    sys.stdout.flush()
+
+
+def _menu_set_webhook(bot):
+    """1. Set Discord Webhook URL"""
+    url = async_input("Enter Discord webhook URL (separate several with commas): ").strip()
+    if url:
+        bot.webhook_url = url
+        print("✓ Webhook URL set successfully!")
+    else:
+        print("✗ Invalid URL!")
+
+
+def _menu_set_app(bot):
+    """2. Set Application Name"""
+    app = async_input("Enter application name (partial name is OK): ").strip()
+    if app:
+        bot.app_name = app.lower()
+        print(f"✓ Application name set to: {bot.app_name}")
+    else:
+        print("✗ Invalid application name!")
+
+
+def _menu_list_apps(bot):
+    """3. List Running Applications"""
+    print("\n--- Running Applications ---")
+    apps = bot.list_running_applications()
+    lines = [f"{i:2d}. {app}" for i, app in enumerate(apps[:20], 1)]
+    if len(apps) > 20:
+        lines.append(f"... and {len(apps) - 20} more applications")
+    # One write instead of a console round-trip per line
+    sys.stdout.write("".join(line + "\n" for line in lines))
+    sys.stdout.flush()
+
+
+def _menu_set_message(bot):
+    """4. Set Custom Message"""
+    print("\n--- Custom Message Setup ---")
+    print("Available variables: {app_name}, {timestamp}, {date}, {time}, {day}, {month}, {year}")
+    print("Leave empty for no message (image only)")
+    print(f"Current: {bot.custom_message}")
+    message = async_input("Enter custom message: ").strip()
+    bot.custom_message = message
+    if message:
+        print(f"✓ Custom message set!")
+        print(f"Preview: {bot.format_message()}")
+    else:
+        print("✓ Message cleared - will send image only")
+
+
+def _menu_set_interval(bot):
+    """5. Set Screenshot Interval"""
+    try:
+        interval = int(async_input(f"Enter interval in seconds (current: {bot.interval}): ").strip())
+        if interval > 0:
+            bot.interval = interval
+            print(f"✓ Interval set to {interval} seconds")
         else:
-            self.root.after(2000, lambda: self.log_message_colored("No previous configuration found. creating cfg.json", 'error'))
-            self.root.after(3000, lambda: self.log_message_colored("successfully created cfg file", 'success'))
-        
-        self.root.mainloop()
+            print("✗ Interval must be greater than 0!")
+    except ValueError:
+        print("✗ Please enter a valid number!")
 
 
-def clear_screen():
-    """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+def _menu_toggle_delete(bot):
+    """6. Toggle Delete After Send"""
+    bot.delete_after_send = not bot.delete_after_send
+    status = "enabled" if bot.delete_after_send else "disabled"
+    print(f"✓ Delete after send {status}")
 
 
-def print_banner():
-    """Print the application banner"""
-    print("=" * 60)
-    print("      APPLICATION SCREENSHOT DISCORD BOT")
-    print("=" * 60)
+def _menu_take_screenshot(bot):
+    """7. Take Single Screenshot"""
+    success, message = bot.take_single_screenshot()
+    print(message)
+
+
+def _menu_start_monitoring(bot):
+    """8. Start Continuous Monitoring"""
+    success, message = bot.start_monitoring()
+    print(message)
+
+
+def _menu_stop_monitoring(bot):
+    """9. Stop Monitoring"""
+    success, message = bot.stop_monitoring()
+    print(message)
+
+
+def _menu_save_config(bot):
+    """10. Save Configuration"""
+    if bot.config_dirty:
+        bot.save_config()
+        print("✓ Configuration saved successfully!")
+    else:
+        print("✓ No changes to save")
 
 
-def print_current_config(bot):
-    """Print current configuration"""
-    print(f"\n--- Current Configuration ---")
-    print(f"Webhook URL: {'✓ Set' if bot.webhook_url else '✗ Not set'}")
-    print(f"Application: {bot.app_name if bot.app_name else '✗ Not set'}")
-    print(f"Custom Message: {bot.custom_message if bot.custom_message else '✗ No message'}")
-    print(f"Interval: {bot.interval} seconds")
-    print(f"Delete after send: {'Yes' if bot.delete_after_send else 'No'}")
-    print(f"Status: {'🟢 Running' if bot.running else '🔴 Stopped'}")
+def _menu_exit(bot):
+    """11. Exit; returns True to leave the menu loop"""
+    if bot.running:
+        print("Stopping monitoring...")
+        bot.stop_monitoring()
+    print("Saving configuration...")
+    bot.save_config()
+    print("Goodbye!")
+    return True
+
+
+def _menu_invalid(bot):
+    """Any unrecognised choice"""
+    print("✗ Invalid choice! Please enter 1-11.")
+
+
+# Menu choice -> handler(bot); a truthy return value exits the menu
+_HANDLERS = {
+    "1": _menu_set_webhook,
+    "2": _menu_set_app,
+    "3": _menu_list_apps,
+    "4": _menu_set_message,
+    "5": _menu_set_interval,
+    "6": _menu_toggle_delete,
+    "7": _menu_take_screenshot,
+    "8": _menu_start_monitoring,
+    "9": _menu_stop_monitoring,
+    "10": _menu_save_config,
+    "11": _menu_exit,
+}
 
 
 def console_menu():
     """Display the console menu and handle user input"""
     bot = ApplicationScreenshotter()
+    enable_ansi()
     
     while True:
-        clear_screen()
-        print_banner()
-        print_current_config(bot)
-        
-        print("\n--- Menu ---")
-        print("1. Set Discord Webhook URL")
-        print("2. Set Application Name")
-        print("3. List Running Applications")
-        print("4. Set Custom Message")
-        print("5. Set Screenshot Interval")
-        print("6. Toggle Delete After Send")
-        print("7. Take Single Screenshot")
-        print("8. Start Continuous Monitoring")
-        print("9. Stop Monitoring")
-        print("10. Save Configuration")
-        print("11. Exit")
+        draw_menu(bot)
         
         try:
-            choice = input("\nEnter your choice (1-11): ").strip()
-            
-            if choice == "1":
-                url = input("Enter Discord webhook URL: ").strip()
-                if url:
-                    bot.webhook_url = url
-                    print("✓ Webhook URL set successfully!")
-                else:
-                    print("✗ Invalid URL!")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "2":
-                app = input("Enter application name (partial name is OK): ").strip()
-                if app:
-                    bot.app_name = app.lower()
-                    print(f"✓ Application name set to: {bot.app_name}")
-                else:
-                    print("✗ Invalid application name!")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "3":
-                print("\n--- Running Applications ---")
-                apps = bot.list_running_applications()
-                for i, app in enumerate(apps[:20], 1):
-                    print(f"{i:2d}. {app}")
-                if len(apps) > 20:
-                    print(f"... and {len(apps) - 20} more applications")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "4":
-                print("\n--- Custom Message Setup ---")
-                print("Available variables: {app_name}, {timestamp}, {date}, {time}, {day}, {month}, {year}")
-                print("Leave empty for no message (image only)")
-                print(f"Current: {bot.custom_message}")
-                message = input("Enter custom message: ").strip()
-                bot.custom_message = message
-                if message:
-                    print(f"✓ Custom message set!")
-                    print(f"Preview: {bot.format_message()}")
-                else:
-                    print("✓ Message cleared - will send image only")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "5":
-                try:
-                    interval = int(input(f"Enter interval in seconds (current: {bot.interval}): ").strip())
-                    if interval > 0:
-                        bot.interval = interval
-                        print(f"✓ Interval set to {interval} seconds")
-                    else:
-                        print("✗ Interval must be greater than 0!")
-                except ValueError:
-                    print("✗ Please enter a valid number!")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "6":
-                bot.delete_after_send = not bot.delete_after_send
-                status = "enabled" if bot.delete_after_send else "disabled"
-                print(f"✓ Delete after send {status}")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "7":
-                success, message = bot.take_single_screenshot()
-                print(message)
-                input("\nPress Enter to continue...")
-                
-            elif choice == "8":
-                success, message = bot.start_monitoring()
-                print(message)
-                input("\nPress Enter to continue...")
-                
-            elif choice == "9":
-                success, message = bot.stop_monitoring()
-                print(message)
-                input("\nPress Enter to continue...")
-                
-            elif choice == "10":
-                bot.save_config()
-                print("✓ Configuration saved successfully!")
-                input("\nPress Enter to continue...")
-                
-            elif choice == "11":
-                if bot.running:
-                    print("Stopping monitoring...")
-                    bot.stop_monitoring()
-                print("Saving configuration...")
-                bot.save_config()
-                print("Goodbye!")
+            choice = async_input("\nEnter your choice (1-11): ").strip()
+            if _HANDLERS.get(choice, _menu_invalid)(bot):
                 break
-                
-            else:
-                print("✗ Invalid choice! Please enter 1-11.")
-                input("\nPress Enter to continue...")
+            async_input("\nPress Enter to continue...")
                 
         except KeyboardInterrupt:
             if bot.running:
@@ -1562,16 +1587,52 @@ def console_menu():
             break
         except Exception as e:
             print(f"✗ An error occurred: {e}")
-            input("\nPress Enter to continue...")
+            async_input("\nPress Enter to continue...")
+
+
+def _display_available():
+    """Best-effort check that a GUI session exists (only Linux/X11 can be headless here)"""
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def run_gui():
+    """Start the tkinter interface, falling back to the console if tkinter can't load
+    
+    GUI_AVAILABLE only checks that the tkinter package exists; _tkinter itself
+    may still be missing or broken.
+    """
+    print("Starting GUI...")
+    try:
+        from gui import ScreenshotBotGUI
+    except ImportError as e:
+        print(f"GUI not available ({e})")
+        print("Starting console interface...")
+        console_menu()
+        return
+    gui = ScreenshotBotGUI(ApplicationScreenshotter())
+    gui.run()
 
 
 def main():
-    """Main function to choose between GUI and console"""
+    """Main function to choose between GUI and console
+    
+    --gui / --console skip the interface prompt; without a display the console is used.
+    """
+    args = sys.argv[1:]
+    if "--console" in args:
+        console_menu()
+        return
+    if "--gui" in args and GUI_AVAILABLE:
+        run_gui()
+        return
+    
     print("=" * 60)
     print("      APPLICATION SCREENSHOT DISCORD BOT")
     print("=" * 60)
     
-    if GUI_AVAILABLE:
+    if GUI_AVAILABLE and _display_available():
         print("\nChoose interface:")
         print("1. GUI (Graphical User Interface)")
         print("2. Console (Command Line Interface)")
@@ -1581,9 +1642,7 @@ def main():
                 choice = input("\nEnter your choice (1-3): ").strip()
                 
                 if choice == "1":
-                    print("Starting GUI...")
-                    gui = ScreenshotBotGUI()
-                    gui.run()
+                    run_gui()
                     break
                 elif choice == "2":
                     console_menu()
@@ -1598,7 +1657,10 @@ def main():
                 print("\nGoodbye!")
                 break
     else:
-        print("\nGUI not available (tkinter not installed)")
+        if GUI_AVAILABLE:
+            print("\nNo display found")
+        else:
+            print("\nGUI not available (tkinter not installed)")
         print("Starting console interface...")
         time.sleep(2)
         console_menu()
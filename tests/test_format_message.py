@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import ApplicationScreenshotter
+
+
+class MessageKeysTest(unittest.TestCase):
+    def test_plain_fields(self):
+        keys = ApplicationScreenshotter._message_keys("{app_name} at {timestamp}")
+        self.assertEqual(keys, {'app_name', 'timestamp'})
+
+    def test_indexed_and_attribute_fields(self):
+        keys = ApplicationScreenshotter._message_keys("{timestamp[0]} {date.year} {time!r:>10}")
+        self.assertEqual(keys, {'timestamp', 'date', 'time'})
+
+    def test_malformed_template(self):
+        self.assertEqual(ApplicationScreenshotter._message_keys("{app_name"), set())
+
+
+class FormatMessageTest(unittest.TestCase):
+    def setUp(self):
+        self.bot = ApplicationScreenshotter()
+        self.bot.app_name = "Foo"
+
+    def test_indexed_field_is_filled(self):
+        self.bot.custom_message = "{year[0]} {app_name[0]}"
+        self.assertEqual(self.bot.format_message(), f"{datetime.now().year}"[0] + " F")
+
+    def test_attribute_field_is_not_unknown(self):
+        message = self.bot.format_message("{date.year}")
+        self.assertNotIn("Unknown variable", message)
+
+    def test_unknown_variable(self):
+        message = self.bot.format_message("{nope[0]}")
+        self.assertEqual(message, "Error in message format: Unknown variable 'nope'")
+
+
+if __name__ == '__main__':
+    unittest.main()